@@ -4,30 +4,65 @@ Monitors and controls Java JAR services running on Windows, macOS, and Linux
 """
 
 from flask import Flask, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+import atexit
 import json
 import os
 import threading
 import time
-from service_monitor import ServiceMonitor
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from types import MappingProxyType
+from service_monitor import ServiceMonitor, extract_port_from_filename
 from msmq_monitor import MSMQMonitor
 from config_storage import (
-    load_config, save_config, get_auto_restart_config_by_name,
+    load_config, save_config,
     save_auto_restart_config, delete_auto_restart_config,
     get_folder_path, save_folder_path
 )
 from constants import (
-    DEFAULT_PORT, DEFAULT_CPU_THRESHOLD, DEFAULT_MEMORY_THRESHOLD_MB,
+    DEFAULT_PORT, DEFAULT_HOST, SERVER_THREADS, DEFAULT_CPU_THRESHOLD, DEFAULT_MEMORY_THRESHOLD_MB,
     DEFAULT_QUEUE_THRESHOLD, CPU_THRESHOLD_MIN, CPU_THRESHOLD_MAX,
     MEMORY_THRESHOLD_MIN_MB, MEMORY_THRESHOLD_MAX_MB,
     QUEUE_THRESHOLD_MIN, QUEUE_THRESHOLD_MAX,
     AUTO_RESTART_CHECK_INTERVAL, AUTO_RESTART_ERROR_RETRY_INTERVAL,
-    RESTART_DELAY_CPU_MEMORY, RESTART_DELAY_QUEUE,
-    SUPPORTED_EXTENSIONS, DASHBOARD_REFRESH_INTERVAL_MS
+    AUTO_RESTART_MIN_CHECK_INTERVAL, AUTO_RESTART_MAX_CHECK_INTERVAL,
+    RESTART_DELAY_CPU_MEMORY, RESTART_DELAY_QUEUE, RESTART_WORKER_COUNT,
+    MIN_RESTART_COOLDOWN_SECONDS,
+    AUTO_RESTART_LOCK_STRIPES,
+    SUPPORTED_EXTENSIONS, ALL_EXTENSIONS, DASHBOARD_REFRESH_INTERVAL_MS,
+    FOLDER_LISTING_CACHE_SIZE, FOLDER_LISTING_CACHE_TTL, SERVICES_CACHE_TTL, POLL_WORKER_COUNT, BYTES_PER_MB
 )
 import logging
 import platform
 
+try:
+    import orjson
+except ImportError:
+    # Optional: orjson serializes API responses faster; fall back to Flask's json provider
+    orjson = None
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes jsonify() responses with orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        # Pretty-printed output (debug mode) keeps the standard encoder
+        if kwargs.get('indent') is not None:
+            return super().dumps(obj, **kwargs)
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 # SECRET_KEY should be set via environment variable for security
 # Example: export FLASK_SECRET_KEY='your-secret-key-here'
 app.config['SECRET_KEY'] = os.environ.get('FLASK_SECRET_KEY', 'change-this-in-production-use-env-variable')
@@ -49,8 +84,38 @@ else:
 
 # In-memory cache for auto-restart config (keyed by PID for active processes)
 # Persistent storage is in monitor_config.json (keyed by service_name)
-auto_restart_config = {}  # {pid: config} - for active processes
+# The mapping is copy-on-write: writers publish a new read-only mapping under
+# auto_restart_lock, so readers can use the current snapshot without locking.
+# Config entries are replaced, never modified in place.
+auto_restart_config = MappingProxyType({})  # {pid: config} - for active processes
 auto_restart_lock = threading.Lock()
+# Striped per-PID locks held across a service's update + persist (or PID rekey), so
+# flows for the same service stay ordered while other services proceed in parallel.
+# auto_restart_lock is only held for the short copy-and-publish of the mapping.
+auto_restart_stripes = [threading.Lock() for _ in range(AUTO_RESTART_LOCK_STRIPES)]
+# Set to wake the auto-restart monitor for an immediate check (e.g. after a config change)
+monitor_wake = threading.Event()
+# When each service was last auto-restarted (time.monotonic()), keyed by service name so
+# it survives the PID change; only used by the auto-restart monitor thread
+last_restart_times = {}  # {service_name: timestamp}
+# Bounded pool for auto-restarts, so a spike across many services queues restarts
+# instead of starting one thread per service
+restart_executor = ThreadPoolExecutor(max_workers=RESTART_WORKER_COUNT, thread_name_prefix='restart')
+atexit.register(lambda: restart_executor.shutdown(wait=False))
+# Runs the MSMQ queue query while the caller scans processes, since the two do not
+# depend on each other and both mostly wait on the OS
+poll_executor = ThreadPoolExecutor(max_workers=POLL_WORKER_COUNT, thread_name_prefix='poll')
+atexit.register(lambda: poll_executor.shutdown(wait=False))
+
+# Last process scan used by /api/services, reused for SERVICES_CACHE_TTL seconds so
+# several dashboard tabs polling at once share one scan of the process table
+services_cache = {'timestamp': None, 'services': []}
+services_cache_lock = threading.Lock()
+
+# Cache of serialized /api/folder/jars responses, keyed by folder and file stats
+# Avoids rescanning and re-sorting the folder when the dashboard polls an unchanged folder
+folder_listing_cache = OrderedDict()  # {(folder, stats): (timestamp, json_body)}
+folder_listing_cache_lock = threading.Lock()
 
 # Load persistent config on startup
 persistent_config = load_config()
@@ -69,7 +134,8 @@ def get_all_executables_from_folder(folder_path):
             'executable_path': full_path,
             'executable_name': filename,
             'subfolder_path': subfolder_path or None (None if directly in folder),
-            'folder_name': folder_name or None
+            'folder_name': folder_name or None,
+            'file_size': size in bytes (not set for shortcuts)
         }
     }
     """
@@ -80,12 +146,7 @@ def get_all_executables_from_folder(folder_path):
     
     try:
         system = platform.system()
-        supported_exts = {
-            'Windows': ['.jar', '.exe', '.bat'],
-            'Darwin': ['.jar', '.sh'],
-            'Linux': ['.jar', '.sh']
-        }
-        extensions = supported_exts.get(system, ['.jar', '.exe', '.bat', '.sh'])
+        extensions = SUPPORTED_EXTENSIONS.get(system, ALL_EXTENSIONS)
         
         # Helper function to resolve Windows shortcut target
         def resolve_shortcut(shortcut_path):
@@ -128,11 +189,16 @@ def get_all_executables_from_folder(folder_path):
                 logger.debug(f"Error resolving shortcut {shortcut_path}: {str(e)}")
             return None
         
+        # List the folder once; DirEntry caches file type and stat results
+        with os.scandir(folder_path) as entries:
+            folder_entries = list(entries)
+        
         # First, scan for files directly in the folder
         direct_files_found = 0
-        for filename in os.listdir(folder_path):
-            file_path = os.path.join(folder_path, filename)
-            if os.path.isfile(file_path):
+        for entry in folder_entries:
+            filename = entry.name
+            file_path = entry.path
+            if entry.is_file():
                 file_ext = os.path.splitext(filename)[1].lower()
                 
                 # Handle Windows shortcuts (.lnk files)
@@ -161,21 +227,7 @@ def get_all_executables_from_folder(folder_path):
                     file_name_without_ext = os.path.splitext(filename)[0]
                     
                     # Extract port/identifier from filename
-                    import re
-                    port_identifier = None
-                    port_patterns = [
-                        r'_(\d+)',           # _8080
-                        r'-(\d+)',           # -8080
-                        r'Port(\d+)',        # Port8080
-                        r'port(\d+)',        # port8080
-                    ]
-                    for pattern in port_patterns:
-                        match = re.search(pattern, filename, re.IGNORECASE)
-                        if match:
-                            port = match.group(1)
-                            if port.isdigit() and 1 <= int(port) <= 65535:
-                                port_identifier = port
-                                break
+                    port_identifier = extract_port_from_filename(filename, any_number=False)
                     
                     # Use filename with port as key if port exists, otherwise use base name
                     # This allows multiple executables with same base name but different ports
@@ -187,7 +239,8 @@ def get_all_executables_from_folder(folder_path):
                         'subfolder_path': None,  # Directly in folder
                         'folder_name': None,
                         'port_identifier': port_identifier,  # Port number if found in filename
-                        'base_name': file_name_without_ext  # Base name without port
+                        'base_name': file_name_without_ext,  # Base name without port
+                        'file_size': entry.stat().st_size
                     }
                     direct_files_found += 1
                     logger.debug(f"Found direct executable: {filename} (port: {port_identifier}) in {folder_path}")
@@ -195,16 +248,18 @@ def get_all_executables_from_folder(folder_path):
         logger.info(f"Found {direct_files_found} executable files directly in folder")
         
         # Then, scan subfolders (for backward compatibility)
-        for item_name in os.listdir(folder_path):
-            item_path = os.path.join(folder_path, item_name)
-            if os.path.isdir(item_path):
+        for item in folder_entries:
+            item_name = item.name
+            item_path = item.path
+            if item.is_dir():
                 # Look for executable files inside this subfolder
                 folder_name_without_ext = os.path.splitext(item_name)[0]
-                for filename in os.listdir(item_path):
-                    file_ext = os.path.splitext(filename)[1].lower()
-                    if file_ext in extensions:
-                        file_path = os.path.join(item_path, filename)
-                        if os.path.isfile(file_path):
+                with os.scandir(item_path) as sub_entries:
+                    for sub_entry in sub_entries:
+                        filename = sub_entry.name
+                        file_ext = os.path.splitext(filename)[1].lower()
+                        if file_ext in extensions and sub_entry.is_file():
+                            file_path = sub_entry.path
                             file_name_without_ext = os.path.splitext(filename)[0]
                             # Match if filename matches folder name (subfolder structure)
                             # OR add it if it's a direct file in subfolder (for flexibility)
@@ -214,7 +269,8 @@ def get_all_executables_from_folder(folder_path):
                                     'executable_path': file_path,
                                     'executable_name': filename,
                                     'subfolder_path': item_path,
-                                    'folder_name': folder_name_without_ext
+                                    'folder_name': folder_name_without_ext,
+                                    'file_size': sub_entry.stat().st_size
                                 }
                             else:
                                 # Direct file in subfolder: use filename as key
@@ -222,7 +278,8 @@ def get_all_executables_from_folder(folder_path):
                                     'executable_path': file_path,
                                     'executable_name': filename,
                                     'subfolder_path': item_path,
-                                    'folder_name': folder_name_without_ext
+                                    'folder_name': folder_name_without_ext,
+                                    'file_size': sub_entry.stat().st_size
                                 }
     except Exception as e:
         logger.error(f"Error scanning folder for executables: {str(e)}", exc_info=True)
@@ -231,6 +288,162 @@ def get_all_executables_from_folder(folder_path):
     return executables_map
 
 
+def get_auto_restart_snapshot():
+    """Return the current read-only auto-restart config mapping (no locking needed)"""
+    return auto_restart_config
+
+
+def has_enabled_auto_restart():
+    """Return True if any service has CPU/memory auto-restart enabled"""
+    return any(config.get('enabled', False) for config in auto_restart_config.values())
+
+
+def get_adaptive_check_interval(min_headroom):
+    """
+    Seconds until the next auto-restart check, scaled by the smallest threshold headroom.
+    min_headroom is the unused fraction of the closest threshold (0 = at the threshold,
+    1 = no load), or None when no service was checked.
+    """
+    if min_headroom is None:
+        return AUTO_RESTART_CHECK_INTERVAL
+    headroom = max(0.0, min(1.0, min_headroom))
+    return AUTO_RESTART_MIN_CHECK_INTERVAL + (AUTO_RESTART_MAX_CHECK_INTERVAL - AUTO_RESTART_MIN_CHECK_INTERVAL) * headroom
+
+
+def update_auto_restart_config(mutate):
+    """
+    Apply mutate(configs) to a copy of the auto-restart config and publish the copy.
+    Runs under auto_restart_lock so concurrent writers do not lose updates.
+    Returns the value returned by mutate.
+    """
+    global auto_restart_config
+    with auto_restart_lock:
+        configs = dict(auto_restart_config)
+        result = mutate(configs)
+        auto_restart_config = MappingProxyType(configs)
+    return result
+
+
+def in_restart_cooldown(service_name):
+    """Return True if service_name was auto-restarted less than MIN_RESTART_COOLDOWN_SECONDS ago"""
+    last_restart_at = last_restart_times.get(service_name)
+    return last_restart_at is not None and time.monotonic() - last_restart_at < MIN_RESTART_COOLDOWN_SECONDS
+
+
+def lock_auto_restart_pids(*pids):
+    """
+    Acquire the stripe locks for the given PIDs (use as a context manager).
+    Stripes are taken in index order so PID rekeys cannot deadlock.
+    """
+    stack = ExitStack()
+    for index in sorted({pid % AUTO_RESTART_LOCK_STRIPES for pid in pids}):
+        stack.enter_context(auto_restart_stripes[index])
+    return stack
+
+
+def set_restarting_flag(pid, restarting):
+    """Set the restarting flag of a process's auto-restart config, if it has one"""
+    def apply(configs):
+        if pid in configs:
+            configs[pid] = dict(configs[pid], restarting=restarting)
+    with lock_auto_restart_pids(pid):
+        update_auto_restart_config(apply)
+
+
+def get_cached_services():
+    """
+    Return monitor.get_all_services(), reusing the last scan for SERVICES_CACHE_TTL seconds.
+    Concurrent callers wait for a single scan. Each call gets its own service dicts.
+    """
+    global services_cache
+    with services_cache_lock:
+        cached = services_cache
+        now = time.monotonic()
+        if cached['timestamp'] is None or now - cached['timestamp'] >= SERVICES_CACHE_TTL:
+            cached = {'timestamp': now, 'services': monitor.get_all_services()}
+            services_cache = cached
+    return [dict(service) for service in cached['services']]
+
+
+def invalidate_services_cache():
+    """Force the next /api/services call to rescan (after starting or stopping a service)"""
+    global services_cache
+    with services_cache_lock:
+        services_cache = {'timestamp': None, 'services': []}
+
+
+def get_folder_listing_key(folder_path):
+    """
+    Build a cache key for a folder listing.
+    Adding, removing or renaming a file updates the mtime of its parent directory,
+    so the key includes the folder's mtime and the mtime of each direct subfolder.
+    Overwriting a file in place does not, so the key also includes the size and mtime
+    of each direct entry; changes inside subfolders and shortcut targets are picked up
+    when the entry expires (FOLDER_LISTING_CACHE_TTL).
+    """
+    entry_stats = []
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            try:
+                entry_stat = entry.stat()
+            except OSError:
+                continue  # Broken link or entry removed during the scan
+            entry_stats.append((entry.name, entry_stat.st_size, entry_stat.st_mtime_ns))
+    entry_stats.sort()
+    return (os.path.normpath(folder_path), os.stat(folder_path).st_mtime_ns, tuple(entry_stats))
+
+
+class AutoRestartPayload:
+    """Validated request body for the auto-restart, queue-threshold and restart endpoints"""
+    
+    __slots__ = ('enabled', 'cpu_threshold', 'memory_threshold_mb', 'queue_threshold', 'jar_name')
+    
+    def __init__(self, enabled, cpu_threshold, memory_threshold_mb, queue_threshold, jar_name):
+        self.enabled = enabled
+        self.cpu_threshold = cpu_threshold
+        self.memory_threshold_mb = memory_threshold_mb
+        self.queue_threshold = queue_threshold
+        self.jar_name = jar_name
+
+
+def parse_auto_restart_payload(data):
+    """
+    Parse and validate an auto-restart request body in a single pass.
+    Missing fields fall back to the defaults from constants.py.
+    Raises ValueError with a user-facing message on invalid input, including a missing
+    or non-JSON body (None from get_json(silent=True)), which must not read as enabled=False.
+    """
+    if not isinstance(data, dict):
+        raise ValueError('Request body must be a JSON object')
+    
+    try:
+        cpu_threshold = float(data.get('cpu_threshold', DEFAULT_CPU_THRESHOLD))
+        memory_threshold_mb = float(data.get('memory_threshold_mb', DEFAULT_MEMORY_THRESHOLD_MB))
+        queue_threshold = float(data.get('queue_threshold', DEFAULT_QUEUE_THRESHOLD))
+    except (TypeError, ValueError):
+        raise ValueError('Thresholds must be numbers')
+    
+    # Validate CPU threshold
+    if cpu_threshold < CPU_THRESHOLD_MIN or cpu_threshold > CPU_THRESHOLD_MAX:
+        raise ValueError(f'CPU threshold must be between {CPU_THRESHOLD_MIN} and {CPU_THRESHOLD_MAX}')
+    
+    # Validate memory threshold
+    if memory_threshold_mb < MEMORY_THRESHOLD_MIN_MB or memory_threshold_mb > MEMORY_THRESHOLD_MAX_MB:
+        raise ValueError(f'Memory threshold must be between {MEMORY_THRESHOLD_MIN_MB} MB and {MEMORY_THRESHOLD_MAX_MB} MB (10 GB)')
+    
+    # Validate queue threshold
+    if queue_threshold < QUEUE_THRESHOLD_MIN or queue_threshold > QUEUE_THRESHOLD_MAX:
+        raise ValueError(f'Queue threshold must be between {QUEUE_THRESHOLD_MIN} and {QUEUE_THRESHOLD_MAX:,} messages')
+    
+    return AutoRestartPayload(
+        enabled=bool(data.get('enabled', False)),
+        cpu_threshold=cpu_threshold,
+        memory_threshold_mb=memory_threshold_mb,
+        queue_threshold=int(queue_threshold),
+        jar_name=data.get('jar_name')
+    )
+
+
 @app.route('/')
 def index():
     """Main dashboard page"""
@@ -253,8 +466,13 @@ def get_services():
     """Get list of all Java JAR services with their status and utilization"""
     global auto_restart_config, jar_folder_path
     try:
-        # Get all running services
-        all_services = monitor.get_all_services()
+        # Query MSMQ queues in the background while processes are scanned and matched
+        queues_future = None
+        if msmq_available and platform.system() == 'Windows':
+            queues_future = poll_executor.submit(msmq_monitor.get_all_queues)
+        
+        # Get all running services (shared with other requests for SERVICES_CACHE_TTL seconds)
+        all_services = get_cached_services()
         logger.info(f"Found {len(all_services)} total running services (JAR/EXE/BAT/SH)")
         if all_services:
             logger.info(f"Sample running services: {[(s.get('service_name') or s.get('jar_name'), s.get('service_path') or s.get('jar_path')) for s in all_services[:5]]}")
@@ -270,13 +488,19 @@ def get_services():
         executable_names = set()
         executable_paths = set()
         executable_names_to_info = {}  # {executable_name: info}
+        # Normalized paths are computed once here instead of once per service below
+        normalized_exe_paths = {}  # {exe_name: normalized executable path}
+        executable_paths_to_info = {}  # {normalized executable path: info}
         
         for exe_name, exe_info in folder_executables_map.items():
+            exe_path_normalized = os.path.normpath(exe_info['executable_path']).lower()
             executable_names.add(exe_name.lower())
             executable_names.add(exe_info['executable_name'].lower())
-            executable_paths.add(os.path.normpath(exe_info['executable_path']).lower())
+            executable_paths.add(exe_path_normalized)
             executable_names_to_info[exe_name.lower()] = exe_info
             executable_names_to_info[exe_info['executable_name'].lower()] = exe_info
+            normalized_exe_paths[exe_name] = exe_path_normalized
+            executable_paths_to_info.setdefault(exe_path_normalized, exe_info)
         
         # Filter services to only include those matching executables in the folder
         # Match by executable filename (not path) so services run from different locations are still detected
@@ -389,7 +613,7 @@ def get_services():
                             break
                 
                 # Also check exact path match (highest priority)
-                if service_path_normalized == os.path.normpath(exe_info['executable_path']).lower():
+                if service_path_normalized == normalized_exe_paths[exe_name]:
                     matches = True
                     matched_exe_info = exe_info
                     logger.info(f"✓ Matched service '{service_name}' by exact path: '{service_path}'")
@@ -399,14 +623,10 @@ def get_services():
             if not matches:
                 if service_path_normalized in executable_paths:
                     matches = True
-                    # Find the matching exe_info
-                    for exe_name, exe_info in folder_executables_map.items():
-                        if os.path.normpath(exe_info['executable_path']).lower() == service_path_normalized:
-                            matched_exe_info = exe_info
-                            break
+                    matched_exe_info = executable_paths_to_info[service_path_normalized]
                 elif service_path_normalized:
                     for exe_name, exe_info in folder_executables_map.items():
-                        exe_path = os.path.normpath(exe_info['executable_path']).lower()
+                        exe_path = normalized_exe_paths[exe_name]
                         if exe_path in service_path_normalized or service_path_normalized in exe_path:
                             matches = True
                             matched_exe_info = exe_info
@@ -436,9 +656,9 @@ def get_services():
         # Get MSMQ queue information (Windows only)
         queues_info = {}
         all_queues_list = []  # Store all queues for display even if not matched
-        if msmq_available and platform.system() == 'Windows':
+        if queues_future is not None:
             try:
-                all_queues = msmq_monitor.get_all_queues()
+                all_queues = queues_future.result()
                 all_queues_list = all_queues  # Store for potential display
                 
                 for queue in all_queues:
@@ -497,68 +717,79 @@ def get_services():
         
         # Add auto-restart configuration and MSMQ info to each service
         # First check in-memory (by PID), then check persistent storage (by service name)
-        with auto_restart_lock:
-            for service in services:
-                pid = service['pid']
-                service_name = service.get('service_name') or service.get('jar_name', 'Unknown')
-                service_path = service.get('service_path') or service.get('jar_path', '')
-                
-                # Match MSMQ queue to service by multiple methods:
-                # 1. Match by service name (executable name)
-                # 2. Match by service path (full executable path)
-                # 3. Match by folder name (if service path contains a known folder)
-                matched_queue = None
-                
-                # Method 1: Direct name match
-                if service_name in queues_info:
-                    matched_queue = queues_info[service_name]
-                else:
-                    # Method 2: Match by service path
-                    if service_path:
-                        # Normalize paths for comparison
-                        service_path_normalized = os.path.normpath(service_path).lower()
-                        for exe_name, queue_info in queues_info.items():
-                            exe_path_normalized = os.path.normpath(queue_info.get('executable_path', '')).lower()
-                            if service_path_normalized == exe_path_normalized:
-                                matched_queue = queue_info
-                                break
-                        
-                        # Method 3: Match by folder name (extract folder from path)
-                        if not matched_queue:
-                            # Try to match by folder name from service path
-                            for exe_name, exe_info in folder_executables_map.items():
-                                if exe_info.get('subfolder_path'):
-                                    folder_path_normalized = os.path.normpath(exe_info['subfolder_path']).lower()
-                                    if folder_path_normalized in service_path_normalized:
-                                        # Found matching folder, now find its queue
-                                        exe_file_name = exe_info['executable_name']
-                                        if exe_file_name in queues_info:
-                                            matched_queue = queues_info[exe_file_name]
-                                            break
-                
-                service['msmq_queue'] = matched_queue
-                
-                # Check in-memory config first (for active processes)
-                if pid in auto_restart_config:
-                    service['auto_restart'] = auto_restart_config[pid]
+        restart_configs = get_auto_restart_snapshot()
+        # Persistent configs are read once per request (read-only), not once per service
+        persistent_restart_configs = load_config().get('auto_restart') or {}
+        loaded_configs = {}  # {pid: config} loaded from persistent storage, published once below
+        for service in services:
+            pid = service['pid']
+            service_name = service.get('service_name') or service.get('jar_name', 'Unknown')
+            service_path = service.get('service_path') or service.get('jar_path', '')
+            
+            # Match MSMQ queue to service by multiple methods:
+            # 1. Match by service name (executable name)
+            # 2. Match by service path (full executable path)
+            # 3. Match by folder name (if service path contains a known folder)
+            matched_queue = None
+            
+            # Method 1: Direct name match
+            if service_name in queues_info:
+                matched_queue = queues_info[service_name]
+            else:
+                # Method 2: Match by service path
+                if service_path:
+                    # Normalize paths for comparison
+                    service_path_normalized = os.path.normpath(service_path).lower()
+                    for exe_name, queue_info in queues_info.items():
+                        exe_path_normalized = os.path.normpath(queue_info.get('executable_path', '')).lower()
+                        if service_path_normalized == exe_path_normalized:
+                            matched_queue = queue_info
+                            break
+                    
+                    # Method 3: Match by folder name (extract folder from path)
+                    if not matched_queue:
+                        # Try to match by folder name from service path
+                        for exe_name, exe_info in folder_executables_map.items():
+                            if exe_info.get('subfolder_path'):
+                                folder_path_normalized = os.path.normpath(exe_info['subfolder_path']).lower()
+                                if folder_path_normalized in service_path_normalized:
+                                    # Found matching folder, now find its queue
+                                    exe_file_name = exe_info['executable_name']
+                                    if exe_file_name in queues_info:
+                                        matched_queue = queues_info[exe_file_name]
+                                        break
+            
+            service['msmq_queue'] = matched_queue
+            
+            # Check in-memory config first (for active processes)
+            if pid in restart_configs:
+                service['auto_restart'] = restart_configs[pid]
+            else:
+                # Check persistent storage by service name
+                persistent_config_data = persistent_restart_configs.get(service_name)
+                if persistent_config_data:
+                    # Load into memory cache and remove restarting flag
+                    config_copy = persistent_config_data.copy()
+                    config_copy['restarting'] = False
+                    loaded_configs[pid] = config_copy
+                    service['auto_restart'] = config_copy
                 else:
-                    # Check persistent storage by service name
-                    persistent_config_data = get_auto_restart_config_by_name(service_name)
-                    if persistent_config_data:
-                        # Load into memory cache and remove restarting flag
-                        config_copy = persistent_config_data.copy()
-                        config_copy['restarting'] = False
-                        auto_restart_config[pid] = config_copy
-                        service['auto_restart'] = config_copy
-                    else:
-                        # Default config
-                        service['auto_restart'] = {
-                            'enabled': False,
-                            'cpu_threshold': DEFAULT_CPU_THRESHOLD,
-                            'memory_threshold_mb': DEFAULT_MEMORY_THRESHOLD_MB,
-                            'queue_threshold': DEFAULT_QUEUE_THRESHOLD,
-                            'restarting': False
-                        }
+                    # Default config
+                    service['auto_restart'] = {
+                        'enabled': False,
+                        'cpu_threshold': DEFAULT_CPU_THRESHOLD,
+                        'memory_threshold_mb': DEFAULT_MEMORY_THRESHOLD_MB,
+                        'queue_threshold': DEFAULT_QUEUE_THRESHOLD,
+                        'restarting': False
+                    }
+        
+        if loaded_configs:
+            def load_persistent_configs(configs):
+                for pid, config in loaded_configs.items():
+                    configs.setdefault(pid, config)
+            update_auto_restart_config(load_persistent_configs)
+            # Wake the monitor in case it is idle waiting for a config
+            monitor_wake.set()
         
         return jsonify({
             'success': True,
@@ -574,6 +805,22 @@ def get_services():
         }), 500
 
 
+@app.route('/api/services/columnar', methods=['GET'])
+def get_services_columnar():
+    """Get all running services as a compact header + rows payload for the dashboard table"""
+    try:
+        return jsonify({
+            'success': True,
+            **monitor.get_all_services_columnar(get_cached_services())
+        })
+    except Exception as e:
+        logger.error(f"Error getting columnar services: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @app.route('/api/service/<int:pid>', methods=['GET'])
 def get_service_details(pid):
     """Get detailed information about a specific service"""
@@ -601,11 +848,15 @@ def get_service_details(pid):
 def stop_service(pid):
     """Stop a Java JAR service"""
     try:
-        result = monitor.stop_service(pid)
+        # Return right after terminate(); the exit is confirmed in the background and the
+        # services cache is dropped again once the process is gone
+        result = monitor.stop_service(pid, on_done=lambda stop_result: invalidate_services_cache())
+        invalidate_services_cache()
         if result['success']:
             return jsonify({
                 'success': True,
-                'message': f'Service {pid} stopped successfully'
+                'pending': result.get('pending', False),
+                'message': f'Service {pid} is stopping' if result.get('pending') else f'Service {pid} stopped successfully'
             })
         else:
             return jsonify({
@@ -620,43 +871,32 @@ def stop_service(pid):
         }), 500
 
 
-@app.route('/api/service/<int:pid>/start', methods=['POST'])
-def start_service(pid):
-    """Start a Java JAR service (requires jar_path in request body, optionally working_directory)"""
+@app.route('/api/service/<int:pid>/stop/status', methods=['GET'])
+def get_stop_status(pid):
+    """Get the result of a stop started by /api/service/<pid>/stop"""
     try:
-        data = request.get_json()
-        jar_path = data.get('jar_path') if data else None
-        working_directory = data.get('working_directory') if data else None
-        
-        if not jar_path:
-            return jsonify({
-                'success': False,
-                'error': 'jar_path is required'
-            }), 400
-        
-        result = monitor.start_service(jar_path, working_directory=working_directory)
-        if result['success']:
-            return jsonify({
-                'success': True,
-                'message': f'Service started successfully',
-                'pid': result.get('pid')
-            })
-        else:
+        result = monitor.get_stop_status(pid)
+        if result is None:
             return jsonify({
                 'success': False,
-                'error': result.get('error', 'Failed to start service')
-            }), 400
+                'error': f'No stop in progress for service {pid}'
+            }), 404
+        return jsonify(result)
     except Exception as e:
-        logger.error(f"Error starting service: {str(e)}")
+        logger.error(f"Error getting stop status: {str(e)}")
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
 
+@app.route('/api/service/<int:pid>/start', methods=['POST'])
 @app.route('/api/service/start', methods=['POST'])
-def start_service_direct():
-    """Start a Java JAR service directly (no PID required)"""
+def start_service(pid=None):
+    """
+    Start a Java JAR service (requires jar_path in request body, optionally working_directory)
+    Served both with a PID (restarting a listed service) and without one (starting from the folder)
+    """
     try:
         data = request.get_json()
         jar_path = data.get('jar_path') if data else None
@@ -673,11 +913,16 @@ def start_service_direct():
         if working_directory:
             working_directory = os.path.normpath(working_directory)
         
-        result = monitor.start_service(jar_path, working_directory=working_directory)
+        # Return right after launching; an early exit is detected in the background and the
+        # services cache is dropped again once the start is confirmed or has failed
+        result = monitor.start_service(jar_path, working_directory=working_directory,
+                                       on_done=lambda start_result: invalidate_services_cache())
+        invalidate_services_cache()
         if result['success']:
             return jsonify({
                 'success': True,
-                'message': f'Service started successfully',
+                'pending': result.get('pending', False),
+                'message': 'Service is starting' if result.get('pending') else 'Service started successfully',
                 'pid': result.get('pid')
             })
         else:
@@ -693,6 +938,25 @@ def start_service_direct():
         }), 500
 
 
+@app.route('/api/service/<int:pid>/start/status', methods=['GET'])
+def get_start_status(pid):
+    """Get the result of a start launched by /api/service/start"""
+    try:
+        result = monitor.get_start_status(pid)
+        if result is None:
+            return jsonify({
+                'success': False,
+                'error': f'No start in progress for service {pid}'
+            }), 404
+        return jsonify(result)
+    except Exception as e:
+        logger.error(f"Error getting start status: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @app.route('/api/folder/get', methods=['GET'])
 def get_folder_path():
     """Get the current folder path"""
@@ -784,6 +1048,21 @@ def list_jar_files():
                 'error': f'Folder does not exist: {folder}'
             }), 400
         
+        # Serve the cached response if the folder has not changed since the last scan
+        cache_key = get_folder_listing_key(folder)
+        cached_body = None
+        with folder_listing_cache_lock:
+            cached = folder_listing_cache.get(cache_key)
+            if cached is not None:
+                cached_at, cached_body = cached
+                if time.monotonic() - cached_at < FOLDER_LISTING_CACHE_TTL:
+                    folder_listing_cache.move_to_end(cache_key)
+                else:
+                    del folder_listing_cache[cache_key]
+                    cached_body = None
+        if cached_body is not None:
+            return app.response_class(cached_body, mimetype='application/json')
+        
         # Get all executables using the helper function
         executables_map = get_all_executables_from_folder(folder)
         
@@ -798,12 +1077,14 @@ def list_jar_files():
                     # Direct file in folder (or shortcut resolved to a file)
                     executable_path = exe_info['executable_path']
                     
-                    # Check if file exists (for shortcuts, check the target)
-                    if not os.path.exists(executable_path):
-                        logger.debug(f"Skipping non-existent file: {executable_path}")
-                        continue
-                    
-                    file_size = os.path.getsize(executable_path)
+                    # Size comes from the folder scan; shortcut targets still need a stat
+                    file_size = exe_info.get('file_size')
+                    if file_size is None:
+                        # Check if file exists (for shortcuts, check the target)
+                        if not os.path.exists(executable_path):
+                            logger.debug(f"Skipping non-existent file: {executable_path}")
+                            continue
+                        file_size = os.path.getsize(executable_path)
                     file_ext = os.path.splitext(exe_info['executable_name'])[1].lower()
                     file_type = file_ext.upper().replace('.', '')
                     
@@ -821,7 +1102,7 @@ def list_jar_files():
                         'path': executable_path,  # Actual executable path (target for shortcuts)
                         'shortcut_path': exe_info.get('shortcut_path'),  # Original shortcut path if exists
                         'subfolder_path': None,
-                        'size_mb': round(file_size / (1024 * 1024), 2),
+                        'size_mb': round(file_size / BYTES_PER_MB, 2),
                         'type': file_type,
                         'extension': file_ext,
                         'original_name': exe_info['executable_name'],  # Keep original for matching
@@ -842,14 +1123,16 @@ def list_jar_files():
                             'executables': []
                         }
                     
-                    file_size = os.path.getsize(exe_info['executable_path'])
+                    file_size = exe_info.get('file_size')
+                    if file_size is None:
+                        file_size = os.path.getsize(exe_info['executable_path'])
                     file_ext = os.path.splitext(exe_info['executable_name'])[1].lower()
                     file_type = file_ext.upper().replace('.', '')
                     subfolder_map[subfolder_path]['executables'].append({
                         'name': exe_info['executable_name'],
                         'path': exe_info['executable_path'],
                         'subfolder_path': subfolder_path,
-                        'size_mb': round(file_size / (1024 * 1024), 2),
+                        'size_mb': round(file_size / BYTES_PER_MB, 2),
                         'type': file_type,
                         'extension': file_ext,
                         'port_identifier': exe_info.get('port_identifier'),  # Port number if found in filename
@@ -875,12 +1158,21 @@ def list_jar_files():
                 'error': str(e)
             }), 500
         
-        return jsonify({
+        response = jsonify({
             'success': True,
             'direct_files': direct_files,  # Files directly in folder
             'subfolders': subfolders_with_executables,  # Files in subfolders
             'folder_path': folder
         })
+        
+        # Cache the serialized body, evicting the least recently used listing when full
+        with folder_listing_cache_lock:
+            folder_listing_cache[cache_key] = (time.monotonic(), response.get_data())
+            folder_listing_cache.move_to_end(cache_key)
+            while len(folder_listing_cache) > FOLDER_LISTING_CACHE_SIZE:
+                folder_listing_cache.popitem(last=False)
+        
+        return response
     except Exception as e:
         logger.error(f"Error listing JAR files: {str(e)}")
         return jsonify({
@@ -889,8 +1181,11 @@ def list_jar_files():
         }), 500
 
 
-def restart_service_internal(pid, jar_name=None, delay_seconds=RESTART_DELAY_CPU_MEMORY, working_directory=None):
-    """Internal function to restart a service with configurable delay"""
+def stop_service_for_restart(pid, jar_name=None, working_directory=None):
+    """
+    Resolve the executable to restart and stop the running service
+    Returns {'success': True, 'jar_path': ..., 'working_directory': ...} or an error dict
+    """
     global jar_folder_path
     
     # Determine jar_path: use jar_name + folder_path if provided, otherwise use existing jar_path
@@ -911,7 +1206,7 @@ def restart_service_internal(pid, jar_name=None, delay_seconds=RESTART_DELAY_CPU
                     if folder_name_without_ext.lower() == jar_name_without_ext.lower():
                         # Found matching subfolder, look for executable inside
                         system = platform.system()
-                        extensions = SUPPORTED_EXTENSIONS.get(system, ['.jar', '.exe', '.bat', '.sh'])
+                        extensions = SUPPORTED_EXTENSIONS.get(system, ALL_EXTENSIONS)
                         for filename in os.listdir(item_path):
                             file_ext = os.path.splitext(filename)[1].lower()
                             if file_ext in extensions:
@@ -964,18 +1259,29 @@ def restart_service_internal(pid, jar_name=None, delay_seconds=RESTART_DELAY_CPU
     
     # Stop the service
     stop_result = monitor.stop_service(pid)
+    invalidate_services_cache()
     if not stop_result['success']:
         return {
             'success': False,
             'error': f"Failed to stop service: {stop_result.get('error')}"
         }
     
-    # Wait for the specified delay (default 2 minutes = 120 seconds)
-    logger.info(f"Waiting {delay_seconds} seconds before restarting service {pid}...")
-    time.sleep(delay_seconds)
+    return {
+        'success': True,
+        'jar_path': jar_path,
+        'working_directory': working_dir
+    }
+
+
+def start_stopped_service(jar_path, working_directory=None):
+    """Start a service stopped by stop_service_for_restart"""
+    try:
+        start_result = monitor.start_service(jar_path, working_directory=working_directory)
+    except Exception as e:
+        logger.error("Error starting service %s: %s", jar_path, e)
+        start_result = {'success': False, 'error': str(e)}
+    invalidate_services_cache()
     
-    # Start the service with working directory
-    start_result = monitor.start_service(jar_path, working_directory=working_dir)
     if start_result['success']:
         return {
             'success': True,
@@ -989,12 +1295,46 @@ def restart_service_internal(pid, jar_name=None, delay_seconds=RESTART_DELAY_CPU
         }
 
 
+def restart_service_internal(pid, jar_name=None, delay_seconds=RESTART_DELAY_CPU_MEMORY, working_directory=None, on_done=None):
+    """
+    Internal function to restart a service with configurable delay
+    
+    Without on_done, waits for the delay and returns the restart result.
+    With on_done, returns right after the stop and schedules the start on a timer,
+    so the calling thread is not held for the delay; on_done(result) receives the
+    final result (including stop failures).
+    """
+    stop_result = stop_service_for_restart(pid, jar_name, working_directory)
+    if not stop_result['success']:
+        if on_done:
+            on_done(stop_result)
+        return stop_result
+    
+    jar_path = stop_result['jar_path']
+    working_dir = stop_result['working_directory']
+    
+    # Wait for the specified delay (default 2 minutes = 120 seconds)
+    logger.info("Waiting %s seconds before restarting service %s...", delay_seconds, pid)
+    if on_done is None:
+        time.sleep(delay_seconds)
+        return start_stopped_service(jar_path, working_dir)
+    
+    start_timer = threading.Timer(delay_seconds, lambda: on_done(start_stopped_service(jar_path, working_dir)))
+    start_timer.daemon = True
+    start_timer.start()
+    return {
+        'success': True,
+        'message': f'Service stopped, restart scheduled in {delay_seconds} seconds'
+    }
+
+
 @app.route('/api/service/<int:pid>/restart', methods=['POST'])
 def restart_service(pid):
     """Restart a Java JAR service"""
     try:
-        data = request.get_json()
-        jar_name = data.get('jar_name') if data else None
+        # Only jar_name is used; the body is optional
+        data = request.get_json(silent=True)
+        jar_name = data.get('jar_name') if isinstance(data, dict) else None
         
         result = restart_service_internal(pid, jar_name, delay_seconds=RESTART_DELAY_CPU_MEMORY)
         
@@ -1022,95 +1362,90 @@ def configure_auto_restart(pid):
     """Configure auto-restart for a service"""
     global auto_restart_config
     try:
-        data = request.get_json()
-        enabled = data.get('enabled', False)
-        cpu_threshold = data.get('cpu_threshold', DEFAULT_CPU_THRESHOLD)
-        memory_threshold_mb = data.get('memory_threshold_mb', DEFAULT_MEMORY_THRESHOLD_MB)
-        jar_name = data.get('jar_name')
-        
-        # Validate CPU threshold
-        if cpu_threshold < CPU_THRESHOLD_MIN or cpu_threshold > CPU_THRESHOLD_MAX:
-            return jsonify({
-                'success': False,
-                'error': f'CPU threshold must be between {CPU_THRESHOLD_MIN} and {CPU_THRESHOLD_MAX}'
-            }), 400
-        
-        # Validate memory threshold
-        if memory_threshold_mb < MEMORY_THRESHOLD_MIN_MB or memory_threshold_mb > MEMORY_THRESHOLD_MAX_MB:
-            return jsonify({
-                'success': False,
-                'error': f'Memory threshold must be between {MEMORY_THRESHOLD_MIN_MB} MB and {MEMORY_THRESHOLD_MAX_MB} MB (10 GB)'
-            }), 400
-        
-        # Get queue threshold
-        queue_threshold = data.get('queue_threshold', DEFAULT_QUEUE_THRESHOLD)
-        if queue_threshold < QUEUE_THRESHOLD_MIN or queue_threshold > QUEUE_THRESHOLD_MAX:
-            return jsonify({
-                'success': False,
-                'error': 'Queue threshold must be between 1 and 1,000,000 messages'
-            }), 400
+        payload = parse_auto_restart_payload(request.get_json(silent=True))
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    try:
+        enabled = payload.enabled
+        cpu_threshold = payload.cpu_threshold
+        memory_threshold_mb = payload.memory_threshold_mb
+        queue_threshold = payload.queue_threshold
+        jar_name = payload.jar_name
         
         # Get service name for persistent storage
         service_details = monitor.get_service_details(pid)
         service_name = jar_name or (service_details.get('service_name') if service_details else None) or f'pid_{pid}'
         
-        with auto_restart_lock:
-            if enabled:
+        if enabled:
+            def enable(configs):
                 # Preserve existing config if updating thresholds
-                existing_config = auto_restart_config.get(pid, {})
+                existing_config = configs.get(pid, {})
                 config_data = {
                     'enabled': True,
-                    'cpu_threshold': float(cpu_threshold),
-                    'memory_threshold_mb': float(memory_threshold_mb),
-                    'queue_threshold': int(queue_threshold),
+                    'cpu_threshold': cpu_threshold,
+                    'memory_threshold_mb': memory_threshold_mb,
+                    'queue_threshold': queue_threshold,
                     'jar_name': jar_name or existing_config.get('jar_name'),
                     'restarting': existing_config.get('restarting', False)
                 }
-                
                 # Store in memory (by PID)
-                auto_restart_config[pid] = config_data
+                configs[pid] = config_data
+                return config_data
+            
+            with lock_auto_restart_pids(pid):
+                config_data = update_auto_restart_config(enable)
                 
                 # Store persistently (by service name, without restarting flag)
                 persistent_data = config_data.copy()
                 persistent_data.pop('restarting', None)  # Don't persist restarting state
                 save_auto_restart_config(service_name, persistent_data)
-                
-                logger.info(f"Auto-restart configured for PID {pid} ({service_name}): CPU {cpu_threshold}%, Memory {memory_threshold_mb} MB, Queue {queue_threshold} messages")
-            else:
+            
+            logger.info(f"Auto-restart configured for PID {pid} ({service_name}): CPU {cpu_threshold}%, Memory {memory_threshold_mb} MB, Queue {queue_threshold} messages")
+            
+            # Re-check thresholds now instead of waiting for the next interval
+            monitor_wake.set()
+        else:
+            def disable(configs):
                 # When disabling, preserve queue_threshold if it exists (queue monitoring is independent)
-                existing_config = auto_restart_config.get(pid, {})
+                existing_config = configs.get(pid, {})
+                if existing_config.get('queue_threshold'):
+                    # Keep minimal config for queue monitoring
+                    configs[pid] = {
+                        'enabled': False,  # CPU/Memory auto-restart disabled
+                        'queue_threshold': existing_config['queue_threshold'],
+                        'jar_name': jar_name or existing_config.get('jar_name'),
+                        'restarting': False
+                    }
+                else:
+                    configs.pop(pid, None)
+                return existing_config
+            
+            with lock_auto_restart_pids(pid):
+                existing_config = update_auto_restart_config(disable)
                 existing_queue_threshold = existing_config.get('queue_threshold')
                 
-                if pid in auto_restart_config:
-                    # If queue threshold exists, keep minimal config for queue monitoring
-                    if existing_queue_threshold:
-                        auto_restart_config[pid] = {
-                            'enabled': False,  # CPU/Memory auto-restart disabled
-                            'queue_threshold': existing_queue_threshold,
-                            'jar_name': jar_name or existing_config.get('jar_name'),
-                            'restarting': False
-                        }
-                        # Save queue threshold to persistent storage
-                        persistent_data = {
-                            'enabled': False,
-                            'queue_threshold': existing_queue_threshold,
-                            'jar_name': jar_name or existing_config.get('jar_name')
-                        }
-                        save_auto_restart_config(service_name, persistent_data)
-                    else:
-                        del auto_restart_config[pid]
-                        delete_auto_restart_config(service_name)
+                if existing_queue_threshold:
+                    # Save queue threshold to persistent storage
+                    persistent_data = {
+                        'enabled': False,
+                        'queue_threshold': existing_queue_threshold,
+                        'jar_name': jar_name or existing_config.get('jar_name')
+                    }
+                    save_auto_restart_config(service_name, persistent_data)
                 else:
                     # Remove from persistent storage only if no queue threshold
-                    if not existing_queue_threshold:
-                        delete_auto_restart_config(service_name)
-                
-                logger.info(f"Auto-restart disabled for PID {pid} ({service_name})")
+                    delete_auto_restart_config(service_name)
+            
+            logger.info(f"Auto-restart disabled for PID {pid} ({service_name})")
         
         return jsonify({
             'success': True,
             'message': f'Auto-restart {"enabled" if enabled else "disabled"} for service {pid}',
-            'config': auto_restart_config.get(pid, {}) if enabled else {}
+            'config': config_data if enabled else {}
         })
     except Exception as e:
         logger.error(f"Error configuring auto-restart: {str(e)}")
@@ -1125,15 +1460,14 @@ def get_auto_restart_config(pid):
     """Get auto-restart configuration for a service"""
     global auto_restart_config
     try:
-        with auto_restart_lock:
-            config = auto_restart_config.get(pid, {
-                'enabled': False,
-                'cpu_threshold': DEFAULT_CPU_THRESHOLD,
-                'memory_threshold_mb': DEFAULT_MEMORY_THRESHOLD_MB,
-                'queue_threshold': DEFAULT_QUEUE_THRESHOLD,
-                'jar_name': None,
-                'restarting': False
-            })
+        config = get_auto_restart_snapshot().get(pid, {
+            'enabled': False,
+            'cpu_threshold': DEFAULT_CPU_THRESHOLD,
+            'memory_threshold_mb': DEFAULT_MEMORY_THRESHOLD_MB,
+            'queue_threshold': DEFAULT_QUEUE_THRESHOLD,
+            'jar_name': None,
+            'restarting': False
+        })
         
         return jsonify({
             'success': True,
@@ -1152,42 +1486,50 @@ def set_queue_threshold(pid):
     """Set queue threshold independently (works even if CPU/Memory auto-restart is disabled)"""
     global auto_restart_config
     try:
-        data = request.get_json()
-        queue_threshold = data.get('queue_threshold', DEFAULT_QUEUE_THRESHOLD)
-        jar_name = data.get('jar_name')
-        
-        if queue_threshold < QUEUE_THRESHOLD_MIN or queue_threshold > QUEUE_THRESHOLD_MAX:
-            return jsonify({
-                'success': False,
-                'error': f'Queue threshold must be between {QUEUE_THRESHOLD_MIN} and {QUEUE_THRESHOLD_MAX:,} messages'
-            }), 400
+        payload = parse_auto_restart_payload(request.get_json(silent=True))
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    try:
+        queue_threshold = payload.queue_threshold
+        jar_name = payload.jar_name
         
         # Get service name for persistent storage
         service_details = monitor.get_service_details(pid)
         service_name = jar_name or (service_details.get('service_name') if service_details else None) or f'pid_{pid}'
         
-        with auto_restart_lock:
-            existing_config = auto_restart_config.get(pid, {})
+        def apply(configs):
+            existing_config = configs.get(pid, {})
             
             # Preserve existing CPU/Memory settings if they exist
             config_data = {
                 'enabled': existing_config.get('enabled', False),  # Keep existing enabled state
                 'cpu_threshold': existing_config.get('cpu_threshold', DEFAULT_CPU_THRESHOLD),
                 'memory_threshold_mb': existing_config.get('memory_threshold_mb', DEFAULT_MEMORY_THRESHOLD_MB),
-                'queue_threshold': int(queue_threshold),
+                'queue_threshold': queue_threshold,
                 'jar_name': jar_name or existing_config.get('jar_name'),
                 'restarting': existing_config.get('restarting', False)
             }
             
             # Store in memory (by PID)
-            auto_restart_config[pid] = config_data
+            configs[pid] = config_data
+            return config_data
+        
+        with lock_auto_restart_pids(pid):
+            config_data = update_auto_restart_config(apply)
             
             # Store persistently (by service name, without restarting flag)
             persistent_data = config_data.copy()
             persistent_data.pop('restarting', None)  # Don't persist restarting state
             save_auto_restart_config(service_name, persistent_data)
-            
-            logger.info(f"Queue threshold set for PID {pid} ({service_name}): {queue_threshold} messages")
+        
+        logger.info(f"Queue threshold set for PID {pid} ({service_name}): {queue_threshold} messages")
+        
+        # Re-check thresholds now instead of waiting for the next interval
+        monitor_wake.set()
         
         return jsonify({
             'success': True,
@@ -1220,12 +1562,7 @@ def get_msmq_queues():
         if jar_folder_path and os.path.isdir(jar_folder_path):
             try:
                 system = platform.system()
-                supported_exts = {
-                    'Windows': ['.jar', '.exe', '.bat'],
-                    'Darwin': ['.jar', '.sh'],
-                    'Linux': ['.jar', '.sh']
-                }
-                extensions = supported_exts.get(system, ['.jar', '.exe', '.bat', '.sh'])
+                extensions = SUPPORTED_EXTENSIONS.get(system, ALL_EXTENSIONS)
                 
                 for filename in os.listdir(jar_folder_path):
                     file_ext = os.path.splitext(filename)[1].lower()
@@ -1239,12 +1576,13 @@ def get_msmq_queues():
         # Get all queues
         all_queues = msmq_monitor.get_all_queues()
         
-        # Match queues to executables
+        # Match queues to executables (index built once, not per queue)
+        exe_index = msmq_monitor.build_exe_index(executable_files)
         queues_with_matches = []
         for queue in all_queues:
             queue_name = queue.get('Name', '')
             message_count = queue.get('MessageCount', 0)
-            matched_exe = msmq_monitor.match_queue_to_executable(queue_name, executable_files)
+            matched_exe = msmq_monitor.match_queue_to_executable(queue_name, exe_index)
             
             queue_info = {
                 'queue_name': queue_name,
@@ -1274,80 +1612,51 @@ def auto_restart_monitor():
     """Background thread to monitor CPU, memory utilization, and MSMQ queue counts, then auto-restart services"""
     global auto_restart_config, jar_folder_path
     
+    check_interval = AUTO_RESTART_CHECK_INTERVAL
     while True:
         try:
-            time.sleep(AUTO_RESTART_CHECK_INTERVAL)  # Check every 30 seconds
+            # Check every check_interval seconds (adapted to the last tick's headroom),
+            # or immediately when woken by a config change
+            # Without MSMQ there is nothing to check until auto-restart is enabled for
+            # a service, so sleep until a config change sets monitor_wake
+            idle = not msmq_available and not has_enabled_auto_restart()
+            monitor_wake.wait(timeout=None if idle else check_interval)
+            monitor_wake.clear()
+            check_interval = AUTO_RESTART_CHECK_INTERVAL
+            
+            # Skip the folder and process scans if the wake-up left nothing to check
+            if not msmq_available and not has_enabled_auto_restart():
+                continue
             
             # Get all executables from folder using helper function
             folder_executables_map = get_all_executables_from_folder(jar_folder_path)
             
-            # Get MSMQ queue information (Windows only)
-            queue_message_counts = {}  # {executable_name: message_count}
-            queue_folder_map = {}  # {executable_name: subfolder_path} for restart
-            if msmq_available and platform.system() == 'Windows':
-                try:
-                    all_queues = msmq_monitor.get_all_queues()
-                    logger.debug(f"Found {len(all_queues)} MSMQ queues")
-                    
-                    for queue in all_queues:
-                        queue_name = queue.get('Name', '')
-                        message_count = queue.get('MessageCount', 0)
-                        queue_type = queue.get('QueueType', 'Unknown')
-                        
-                        # Extract simple queue name using improved method
-                        queue_simple_name = msmq_monitor.extract_queue_simple_name(queue_name)
-                        queue_simple_name_no_ext = os.path.splitext(queue_simple_name)[0].lower()
-                        
-                        logger.debug(f"Processing queue: '{queue_name}' -> simple name: '{queue_simple_name}' -> no ext: '{queue_simple_name_no_ext}', messages: {message_count}")
-                        
-                        # Match queue name to executable name
-                        # For shortcuts, match by both shortcut name and target executable name
-                        matched = False
-                        for exe_name, exe_info in folder_executables_map.items():
-                            exe_name_lower = exe_name.lower()
-                            exe_name_no_ext = os.path.splitext(exe_info['executable_name'])[0].lower()
-                            exe_file_name = exe_info['executable_name']
-                            
-                            # Get shortcut name if this is a shortcut (for better matching)
-                            shortcut_name = None
-                            if 'shortcut_path' in exe_info:
-                                shortcut_path = exe_info.get('shortcut_path', '')
-                                if shortcut_path:
-                                    shortcut_filename = os.path.basename(shortcut_path)
-                                    shortcut_name = os.path.splitext(shortcut_filename)[0].lower()
-                            
-                            # Try multiple matching strategies:
-                            # 1. Match by executable name (key in map) - works for shortcuts
-                            # 2. Match by target executable filename
-                            # 3. Match by shortcut name (if it's a shortcut)
-                            if (exe_name_lower == queue_simple_name_no_ext or 
-                                exe_name_no_ext == queue_simple_name_no_ext or
-                                exe_file_name.lower() == queue_simple_name.lower() or
-                                os.path.splitext(exe_file_name)[0].lower() == queue_simple_name_no_ext or
-                                (shortcut_name and shortcut_name == queue_simple_name_no_ext)):
-                                
-                                queue_message_counts[exe_file_name] = message_count
-                                queue_folder_map[exe_file_name] = exe_info.get('subfolder_path')
-                                logger.info(f"Matched MSMQ queue '{queue_name}' ({queue_type}, {message_count} messages) to executable '{exe_file_name}' (shortcut: '{exe_name}')")
-                                matched = True
-                                break
-                        
-                        if not matched:
-                            logger.debug(f"No match found for queue '{queue_name}' (simple name: '{queue_simple_name_no_ext}')")
-                            
-                except Exception as e:
-                    logger.error(f"Error getting MSMQ queues in monitor: {str(e)}", exc_info=True)
+            # Query MSMQ queues in the background while processes are scanned
+            # Let PowerShell drop queues that cannot match an executable in the folder
+            queues_future = None
+            if msmq_available and platform.system() == 'Windows' and folder_executables_map:
+                queue_filter_names = set()
+                for exe_name, exe_info in folder_executables_map.items():
+                    queue_filter_names.add(exe_name)
+                    queue_filter_names.add(exe_info['executable_name'])
+                    if exe_info.get('shortcut_name'):
+                        queue_filter_names.add(exe_info['shortcut_name'])
+                queues_future = poll_executor.submit(msmq_monitor.get_all_queues, filter_names=queue_filter_names)
             
             # Get all running services and filter to only those in our folder
             all_running_services = monitor.get_all_services()
             
-            # Build filter set from folder executables
+            # Build filter set from folder executables, plus a reverse index
+            # {exe name or executable filename: subfolder_path} for restart lookups
             executable_names = set()
             executable_paths = set()
+            folder_executables_index = {}
             for exe_name, exe_info in folder_executables_map.items():
                 executable_names.add(exe_name.lower())
                 executable_names.add(exe_info['executable_name'].lower())
                 executable_paths.add(os.path.normpath(exe_info['executable_path']).lower())
+                folder_executables_index.setdefault(exe_name, exe_info.get('subfolder_path'))
+                folder_executables_index.setdefault(exe_info['executable_name'], exe_info.get('subfolder_path'))
             
             # Filter services to only include those matching executables in the folder
             # Match by executable filename (not path) so services run from different locations are still detected
@@ -1439,6 +1748,72 @@ def auto_restart_monitor():
                 service_name = service.get('service_name') or service.get('jar_name', 'Unknown')
                 service_by_name[service_name] = service
             
+            # Get MSMQ queue information (Windows only)
+            # Queue counts are only looked up by running service name, so only executables
+            # backing a running service need a queue, and the scan stops once all are matched
+            queue_message_counts = {}  # {executable_name: message_count}
+            queue_folder_map = {}  # {executable_name: subfolder_path} for restart
+            unmatched_services = set(service_by_name)
+            if queues_future is not None and unmatched_services:
+                try:
+                    all_queues = queues_future.result()
+                    logger.debug("Found %s MSMQ queues", len(all_queues))
+                    
+                    for queue in all_queues:
+                        if not unmatched_services:
+                            break
+                        
+                        queue_name = queue.get('Name', '')
+                        message_count = queue.get('MessageCount', 0)
+                        queue_type = queue.get('QueueType', 'Unknown')
+                        
+                        # Extract simple queue name using improved method
+                        queue_simple_name = msmq_monitor.extract_queue_simple_name(queue_name)
+                        queue_simple_name_no_ext = os.path.splitext(queue_simple_name)[0].lower()
+                        
+                        logger.debug("Processing queue: '%s' -> simple name: '%s' -> no ext: '%s', messages: %s", queue_name, queue_simple_name, queue_simple_name_no_ext, message_count)
+                        
+                        # Match queue name to executable name
+                        # For shortcuts, match by both shortcut name and target executable name
+                        matched = False
+                        for exe_name, exe_info in folder_executables_map.items():
+                            exe_file_name = exe_info['executable_name']
+                            if exe_file_name not in unmatched_services:
+                                continue
+                            exe_name_lower = exe_name.lower()
+                            exe_name_no_ext = os.path.splitext(exe_file_name)[0].lower()
+                            
+                            # Get shortcut name if this is a shortcut (for better matching)
+                            shortcut_name = None
+                            if 'shortcut_path' in exe_info:
+                                shortcut_path = exe_info.get('shortcut_path', '')
+                                if shortcut_path:
+                                    shortcut_filename = os.path.basename(shortcut_path)
+                                    shortcut_name = os.path.splitext(shortcut_filename)[0].lower()
+                            
+                            # Try multiple matching strategies:
+                            # 1. Match by executable name (key in map) - works for shortcuts
+                            # 2. Match by target executable filename
+                            # 3. Match by shortcut name (if it's a shortcut)
+                            if (exe_name_lower == queue_simple_name_no_ext or 
+                                exe_name_no_ext == queue_simple_name_no_ext or
+                                exe_file_name.lower() == queue_simple_name.lower() or
+                                os.path.splitext(exe_file_name)[0].lower() == queue_simple_name_no_ext or
+                                (shortcut_name and shortcut_name == queue_simple_name_no_ext)):
+                                
+                                queue_message_counts[exe_file_name] = message_count
+                                queue_folder_map[exe_file_name] = exe_info.get('subfolder_path')
+                                unmatched_services.discard(exe_file_name)
+                                logger.info("Matched MSMQ queue '%s' (%s, %s messages) to executable '%s' (shortcut: '%s')", queue_name, queue_type, message_count, exe_file_name, exe_name)
+                                matched = True
+                                break
+                        
+                        if not matched:
+                            logger.debug("No match found for queue '%s' (simple name: '%s')", queue_name, queue_simple_name_no_ext)
+                            
+                except Exception as e:
+                    logger.error("Error getting MSMQ queues in monitor: %s", e, exc_info=True)
+            
             # FIRST: Check MSMQ queues independently for ALL services (regardless of auto-restart setting)
             # This is an additional condition that works independently
             if msmq_available and platform.system() == 'Windows' and queue_message_counts:
@@ -1447,10 +1822,9 @@ def auto_restart_monitor():
                     service_name = service.get('service_name') or service.get('jar_name', 'Unknown')
                     
                     # Skip if already restarting
-                    with auto_restart_lock:
-                        existing_config = auto_restart_config.get(pid, {})
-                        if existing_config.get('restarting', False):
-                            continue
+                    existing_config = get_auto_restart_snapshot().get(pid, {})
+                    if existing_config.get('restarting', False):
+                        continue
                     
                     # Check if this service has a queue with exceeded threshold
                     if service_name in queue_message_counts:
@@ -1458,91 +1832,106 @@ def auto_restart_monitor():
                         # Use default threshold of 1,000 if not configured, or get from config if exists
                         queue_threshold = existing_config.get('queue_threshold', DEFAULT_QUEUE_THRESHOLD)
                         
-                        logger.debug(f"Service {pid} ({service_name}): Queue message count = {queue_message_count}, threshold = {queue_threshold}")
+                        logger.debug("Service %s (%s): Queue message count = %s, threshold = %s", pid, service_name, queue_message_count, queue_threshold)
                         
                         if queue_message_count >= queue_threshold:
-                            logger.warning(f"Service {pid} ({service_name}) MSMQ queue exceeds threshold: {queue_message_count} >= {queue_threshold} messages. Initiating auto-restart...")
+                            if in_restart_cooldown(service_name):
+                                logger.info("Service %s (%s) MSMQ queue exceeds threshold (%s >= %s messages), but it was restarted less than %s seconds ago. Restart throttled.", pid, service_name, queue_message_count, queue_threshold, MIN_RESTART_COOLDOWN_SECONDS)
+                                continue
+                            
+                            logger.warning("Service %s (%s) MSMQ queue exceeds threshold: %s >= %s messages. Initiating auto-restart...", pid, service_name, queue_message_count, queue_threshold)
+                            last_restart_times[service_name] = time.monotonic()
                             
                             # Mark as restarting
-                            with auto_restart_lock:
-                                if pid not in auto_restart_config:
+                            def mark_restarting(configs):
+                                if pid not in configs:
                                     # Create minimal config for queue-based restart
-                                    auto_restart_config[pid] = {
+                                    configs[pid] = {
                                         'enabled': False,  # Queue monitoring is independent
                                         'queue_threshold': queue_threshold,
                                         'jar_name': service_name,
                                         'restarting': True
                                     }
                                 else:
-                                    auto_restart_config[pid]['restarting'] = True
+                                    configs[pid] = dict(configs[pid], restarting=True)
+                            
+                            with lock_auto_restart_pids(pid):
+                                update_auto_restart_config(mark_restarting)
                             
-                            # Restart in a separate thread
-                            def queue_restart_thread():
+                            # Restart on the restart pool
+                            def queue_restart_thread(pid, service_name):
                                 jar_name = service_name
                                 # Get the subfolder path for this service from the map
                                 subfolder_path = queue_folder_map.get(service_name)
-                                result = restart_service_internal(pid, jar_name, delay_seconds=RESTART_DELAY_QUEUE, working_directory=subfolder_path)
                                 
-                                if result['success']:
-                                    logger.info(f"Queue-based auto-restart successful for service {pid} ({service_name}). New PID: {result.get('pid')}")
-                                    new_pid = result.get('pid')
-                                    if new_pid:
-                                        with auto_restart_lock:
-                                            if pid in auto_restart_config:
-                                                old_config = auto_restart_config[pid]
-                                                del auto_restart_config[pid]
+                                def on_restarted(result):
+                                    if result['success']:
+                                        logger.info("Queue-based auto-restart successful for service %s (%s). New PID: %s", pid, service_name, result.get('pid'))
+                                        new_pid = result.get('pid')
+                                        if new_pid:
+                                            def move_to_new_pid(configs):
+                                                old_config = configs.pop(pid, None)
                                                 # Only keep queue threshold if it was set
-                                                if old_config.get('queue_threshold'):
-                                                    auto_restart_config[new_pid] = {
+                                                if old_config and old_config.get('queue_threshold'):
+                                                    configs[new_pid] = {
                                                         'enabled': old_config.get('enabled', False),
                                                         'queue_threshold': old_config['queue_threshold'],
                                                         'jar_name': jar_name,
                                                         'restarting': False
                                                     }
-                                else:
-                                    logger.error(f"Queue-based auto-restart failed for service {pid} ({service_name}): {result.get('error')}")
-                                    with auto_restart_lock:
-                                        if pid in auto_restart_config:
-                                            auto_restart_config[pid]['restarting'] = False
+                                            
+                                            with lock_auto_restart_pids(pid, new_pid):
+                                                update_auto_restart_config(move_to_new_pid)
+                                    else:
+                                        logger.error("Queue-based auto-restart failed for service %s (%s): %s", pid, service_name, result.get('error'))
+                                        set_restarting_flag(pid, False)
+                                
+                                # Returns once stopped; the start runs on a timer after the delay
+                                restart_service_internal(pid, jar_name, delay_seconds=RESTART_DELAY_QUEUE, working_directory=subfolder_path, on_done=on_restarted)
                             
-                            threading.Thread(target=queue_restart_thread, daemon=True).start()
+                            restart_executor.submit(queue_restart_thread, pid, service_name)
                             continue  # Skip to next service
             
             # SECOND: Check CPU and Memory thresholds for services with auto-restart enabled
-            with auto_restart_lock:
-                configs_to_check = list(auto_restart_config.items())
+            configs_to_check = [
+                (pid, config) for pid, config in get_auto_restart_snapshot().items()
+                if config.get('enabled', False) and not config.get('restarting', False)
+            ]
+            
+            # Sample all configured services in one process scan
+            all_details = monitor.get_many_details([pid for pid, _ in configs_to_check]) if configs_to_check else {}
+            
+            # Smallest unused fraction of a CPU/memory threshold, sets the next check interval
+            min_headroom = None
             
             for pid, config in configs_to_check:
-                if not config.get('enabled', False) or config.get('restarting', False):
-                    continue
-                
                 try:
-                    details = monitor.get_service_details(pid)
-                    if not details:
+                    details = all_details.get(pid)
+                    if details is None:
                         # Service no longer exists, remove from config
-                        with auto_restart_lock:
-                            if pid in auto_restart_config:
-                                del auto_restart_config[pid]
+                        with lock_auto_restart_pids(pid):
+                            update_auto_restart_config(lambda configs: configs.pop(pid, None))
                         continue
                     
-                    service_name = details.get('service_name') or details.get('jar_name', 'Unknown')
-                    cpu_percent = details.get('cpu_percent', 0)
-                    memory_mb = details.get('memory_mb', 0)
-                    cpu_threshold = config.get('cpu_threshold', DEFAULT_CPU_THRESHOLD)
-                    memory_threshold_mb = config.get('memory_threshold_mb', DEFAULT_MEMORY_THRESHOLD_MB)
+                    service_name = details.service_name or 'Unknown'
+                    cpu_percent = details.cpu_percent
+                    memory_mb = details.memory_mb
+                    config_get = config.get
+                    cpu_threshold = config_get('cpu_threshold', DEFAULT_CPU_THRESHOLD)
+                    memory_threshold_mb = config_get('memory_threshold_mb', DEFAULT_MEMORY_THRESHOLD_MB)
+                    queue_threshold = config_get('queue_threshold', DEFAULT_QUEUE_THRESHOLD)
                     
                     # Check CPU and memory thresholds
                     cpu_exceeded = cpu_percent >= cpu_threshold
                     memory_exceeded = memory_mb >= memory_threshold_mb
                     
-                    # Check MSMQ queue threshold (only if auto-restart is enabled)
-                    queue_threshold = config.get('queue_threshold', DEFAULT_QUEUE_THRESHOLD)
-                    queue_exceeded = False
-                    queue_message_count = None
+                    headroom = min(1 - cpu_percent / cpu_threshold, 1 - memory_mb / memory_threshold_mb)
+                    if min_headroom is None or headroom < min_headroom:
+                        min_headroom = headroom
                     
-                    if service_name in queue_message_counts:
-                        queue_message_count = queue_message_counts[service_name]
-                        queue_exceeded = queue_message_count >= queue_threshold
+                    # Check MSMQ queue threshold (only if auto-restart is enabled)
+                    queue_message_count = queue_message_counts.get(service_name)
+                    queue_exceeded = queue_message_count is not None and queue_message_count >= queue_threshold
                     
                     # Check if any threshold is exceeded (CPU, Memory, or Queue)
                     if cpu_exceeded or memory_exceeded or queue_exceeded:
@@ -1554,51 +1943,54 @@ def auto_restart_monitor():
                         if queue_exceeded:
                             reason.append(f"MSMQ Queue ({queue_message_count} >= {queue_threshold} messages)")
                         
-                        logger.warning(f"Service {pid} ({service_name}) exceeds threshold(s): {', '.join(reason)}. Initiating auto-restart...")
+                        if in_restart_cooldown(service_name):
+                            logger.info("Service %s (%s) exceeds threshold(s): %s, but it was restarted less than %s seconds ago. Restart throttled.", pid, service_name, ', '.join(reason), MIN_RESTART_COOLDOWN_SECONDS)
+                            continue
+                        
+                        logger.warning("Service %s (%s) exceeds threshold(s): %s. Initiating auto-restart...", pid, service_name, ', '.join(reason))
+                        last_restart_times[service_name] = time.monotonic()
                         
                         # Mark as restarting to prevent multiple restarts
-                        with auto_restart_lock:
-                            if pid in auto_restart_config:
-                                auto_restart_config[pid]['restarting'] = True
+                        set_restarting_flag(pid, True)
                         
-                        # Restart in a separate thread to avoid blocking
-                        def restart_thread():
+                        # Restart on the restart pool to avoid blocking
+                        def restart_thread(pid, config, service_name, queue_exceeded):
                             jar_name = config.get('jar_name')
                             # Use queue delay for queue-based restarts, CPU/memory delay for CPU/memory
                             delay = RESTART_DELAY_QUEUE if queue_exceeded else RESTART_DELAY_CPU_MEMORY
                             # Get subfolder path for this service
-                            subfolder_path = None
-                            if jar_name:
-                                for exe_name, exe_info in folder_executables_map.items():
-                                    if exe_info['executable_name'] == jar_name or exe_name == jar_name:
-                                        subfolder_path = exe_info.get('subfolder_path')
-                                        break
-                            result = restart_service_internal(pid, jar_name, delay_seconds=delay, working_directory=subfolder_path)
+                            subfolder_path = folder_executables_index.get(jar_name) if jar_name else None
                             
-                            if result['success']:
-                                logger.info(f"Auto-restart successful for service {pid} ({service_name}). New PID: {result.get('pid')}")
-                                # Update config with new PID if available
-                                new_pid = result.get('pid')
-                                if new_pid:
-                                    with auto_restart_lock:
-                                        if pid in auto_restart_config:
-                                            old_config = auto_restart_config[pid]
-                                            del auto_restart_config[pid]
-                                            auto_restart_config[new_pid] = old_config
-                                            auto_restart_config[new_pid]['restarting'] = False
-                            else:
-                                logger.error(f"Auto-restart failed for service {pid} ({service_name}): {result.get('error')}")
-                                with auto_restart_lock:
-                                    if pid in auto_restart_config:
-                                        auto_restart_config[pid]['restarting'] = False
+                            def on_restarted(result):
+                                if result['success']:
+                                    logger.info("Auto-restart successful for service %s (%s). New PID: %s", pid, service_name, result.get('pid'))
+                                    # Update config with new PID if available
+                                    new_pid = result.get('pid')
+                                    if new_pid:
+                                        def move_to_new_pid(configs):
+                                            old_config = configs.pop(pid, None)
+                                            if old_config is not None:
+                                                configs[new_pid] = dict(old_config, restarting=False)
+                                        
+                                        with lock_auto_restart_pids(pid, new_pid):
+                                            update_auto_restart_config(move_to_new_pid)
+                                else:
+                                    logger.error("Auto-restart failed for service %s (%s): %s", pid, service_name, result.get('error'))
+                                    set_restarting_flag(pid, False)
+                            
+                            # Returns once stopped; the start runs on a timer after the delay
+                            restart_service_internal(pid, jar_name, delay_seconds=delay, working_directory=subfolder_path, on_done=on_restarted)
                         
-                        threading.Thread(target=restart_thread, daemon=True).start()
+                        restart_executor.submit(restart_thread, pid, config, service_name, queue_exceeded)
                         
                 except Exception as e:
-                    logger.error(f"Error checking service {pid} for auto-restart: {str(e)}")
+                    logger.error("Error checking service %s for auto-restart: %s", pid, e)
+            
+            check_interval = get_adaptive_check_interval(min_headroom)
+            logger.debug("Next auto-restart check in %.0f seconds (min headroom: %s)", check_interval, min_headroom)
                     
         except Exception as e:
-            logger.error(f"Error in auto-restart monitor: {str(e)}")
+            logger.error("Error in auto-restart monitor: %s", e)
             time.sleep(AUTO_RESTART_ERROR_RETRY_INTERVAL)  # Wait longer on error
 
 
@@ -1623,5 +2015,16 @@ if __name__ == '__main__':
     print(f"Access the dashboard at: http://localhost:{port}")
     # Debug mode disabled for production (set debug=False or use environment variable)
     debug_mode = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
-    app.run(debug=debug_mode, host='0.0.0.0', port=port)
+    
+    if debug_mode:
+        app.run(debug=debug_mode, host=DEFAULT_HOST, port=port)
+    else:
+        # Serve with waitress (multi-threaded production WSGI server) when installed
+        try:
+            from waitress import serve
+        except ImportError:
+            logger.warning("waitress is not installed, using the Flask development server")
+            app.run(debug=False, host=DEFAULT_HOST, port=port, threaded=True)
+        else:
+            serve(app, host=DEFAULT_HOST, port=port, threads=SERVER_THREADS)
 
@@ -6,45 +6,116 @@ Handles persistent storage of auto-restart configurations and folder paths
 import json
 import os
 import logging
+import tempfile
 from threading import Lock
 
+try:
+    import orjson
+except ImportError:
+    # Optional: orjson serializes faster; fall back to the standard json module
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 CONFIG_FILE = 'monitor_config.json'
 config_lock = Lock()
 
+# Parsed config file, reused until the file's (mtime, size) changes
+_cached_config = None
+_cached_stamp = None
+
+
+def _get_file_stamp():
+    """Return (mtime_ns, size) of the config file, or None if it does not exist"""
+    try:
+        st = os.stat(CONFIG_FILE)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
 
 def load_config():
-    """Load configuration from file"""
-    if not os.path.exists(CONFIG_FILE):
-        return {
-            'auto_restart': {},  # Keyed by service_name instead of PID
-            'folder_path': None
-        }
+    """
+    Load configuration from file
+    The parsed file is cached and only re-read when the file changes on disk.
+    The returned dict is shared, so callers must not modify it.
+    """
+    global _cached_config, _cached_stamp
     
+    with config_lock:
+        stamp = _get_file_stamp()
+        if stamp is None:
+            return {
+                'auto_restart': {},  # Keyed by service_name instead of PID
+                'folder_path': None
+            }
+        
+        if _cached_config is not None and stamp == _cached_stamp:
+            return _cached_config
+        
+        try:
+            with open(CONFIG_FILE, 'r') as f:
+                config = json.load(f)
+                # Ensure structure exists
+                if 'auto_restart' not in config:
+                    config['auto_restart'] = {}
+                if 'folder_path' not in config:
+                    config['folder_path'] = None
+        except Exception as e:
+            logger.error(f"Error loading config file: {str(e)}")
+            return {
+                'auto_restart': {},
+                'folder_path': None
+            }
+        
+        _cached_config = config
+        _cached_stamp = stamp
+        return config
+
+
+def _load_config_for_update():
+    """Load a copy of the configuration that can be modified and passed to save_config"""
+    config = dict(load_config())
+    config['auto_restart'] = dict(config.get('auto_restart') or {})
+    return config
+
+
+def _serialize_config(config):
+    """Serialize configuration to indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode('utf-8')
+
+
+def _write_config_file(data):
+    """
+    Write the config file atomically: write a temp file in the same folder, then
+    replace the config file with it, so a crash never leaves a truncated file
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(CONFIG_FILE)), prefix='.monitor_config_', suffix='.tmp')
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            config = json.load(f)
-            # Ensure structure exists
-            if 'auto_restart' not in config:
-                config['auto_restart'] = {}
-            if 'folder_path' not in config:
-                config['folder_path'] = None
-            return config
-    except Exception as e:
-        logger.error(f"Error loading config file: {str(e)}")
-        return {
-            'auto_restart': {},
-            'folder_path': None
-        }
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, CONFIG_FILE)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 def save_config(config):
     """Save configuration to file"""
+    global _cached_config, _cached_stamp
+    
     try:
+        data = _serialize_config(config)
         with config_lock:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2)
+            _write_config_file(data)
+            # The saved dict becomes the cached copy, so the next load skips re-parsing
+            _cached_config = config
+            _cached_stamp = _get_file_stamp()
             logger.info(f"Configuration saved to {CONFIG_FILE}")
             return True
     except Exception as e:
@@ -60,18 +131,15 @@ def get_auto_restart_config_by_name(service_name):
 
 def save_auto_restart_config(service_name, config_data):
     """Save auto-restart config for a service by name"""
-    config = load_config()
-    if not config.get('auto_restart'):
-        config['auto_restart'] = {}
-    
+    config = _load_config_for_update()
     config['auto_restart'][service_name] = config_data
     return save_config(config)
 
 
 def delete_auto_restart_config(service_name):
     """Delete auto-restart config for a service"""
-    config = load_config()
-    if service_name in config.get('auto_restart', {}):
+    config = _load_config_for_update()
+    if service_name in config['auto_restart']:
         del config['auto_restart'][service_name]
         return save_config(config)
     return True
@@ -85,7 +153,7 @@ def get_folder_path():
 
 def save_folder_path(folder_path):
     """Save folder path"""
-    config = load_config()
+    config = _load_config_for_update()
     config['folder_path'] = folder_path
     return save_config(config)
 
@@ -6,6 +6,7 @@ Centralized location for all default values and configuration constants
 # Server Configuration
 DEFAULT_PORT = 5001  # Default Flask port (changed from 5000 to avoid macOS AirPlay Receiver conflict)
 DEFAULT_HOST = '0.0.0.0'  # Listen on all interfaces
+SERVER_THREADS = 8  # Request threads for the waitress WSGI server
 
 # Auto-Restart Thresholds (Defaults)
 # ======================================
@@ -34,22 +35,42 @@ QUEUE_THRESHOLD_MAX = 1000000  # Maximum queue threshold (messages)
 
 # Auto-Restart Monitoring Intervals
 AUTO_RESTART_CHECK_INTERVAL = 30  # Check every 30 seconds
+# The interval adapts between these bounds: shorter when a service is close to a
+# CPU/memory threshold, longer when every service is well below its thresholds
+AUTO_RESTART_MIN_CHECK_INTERVAL = 5  # Seconds, when a service is at its threshold
+AUTO_RESTART_MAX_CHECK_INTERVAL = 60  # Seconds, when all services are idle
 AUTO_RESTART_ERROR_RETRY_INTERVAL = 60  # Wait 60 seconds on error before retry
 
 # Restart Delays (in seconds)
 RESTART_DELAY_CPU_MEMORY = 120  # 2 minutes delay for CPU/Memory-based restarts
 RESTART_DELAY_QUEUE = 60  # 1 minute delay for queue-based restarts
+MIN_RESTART_COOLDOWN_SECONDS = 300  # 5 minutes minimum between auto-restarts of the same service
+RESTART_WORKER_COUNT = 8  # Maximum number of auto-restarts running at the same time
+AUTO_RESTART_LOCK_STRIPES = 16  # Number of per-PID locks for auto-restart config updates
 
 # Dashboard UI Configuration
 DASHBOARD_REFRESH_INTERVAL_MS = 20000  # 20 seconds (in milliseconds)
 MESSAGE_DISPLAY_DURATION_MS = 5000  # 5 seconds
 
+# Services Snapshot Cache
+SERVICES_CACHE_TTL = 5  # Seconds a process scan is reused by /api/services
+POLL_WORKER_COUNT = 4  # Threads running MSMQ queue queries alongside process scans
+
+# Folder Listing Cache
+FOLDER_LISTING_CACHE_SIZE = 32  # Maximum number of cached /api/folder/jars responses
+FOLDER_LISTING_CACHE_TTL = 60  # Seconds a cached listing is served; bounds staleness inside subfolders
+
 # Supported File Extensions by OS
 SUPPORTED_EXTENSIONS = {
-    'Windows': ['.jar', '.exe', '.bat'],
-    'Darwin': ['.jar', '.sh'],  # macOS
-    'Linux': ['.jar', '.sh']
+    'Windows': frozenset({'.jar', '.exe', '.bat'}),
+    'Darwin': frozenset({'.jar', '.sh'}),  # macOS
+    'Linux': frozenset({'.jar', '.sh'})
 }
+# Extensions used on any other OS
+ALL_EXTENSIONS = frozenset({'.jar', '.exe', '.bat', '.sh'})
+
+# Units
+BYTES_PER_MB = 1024 * 1024  # Used to convert file sizes to MB
 
 # File Type Labels
 FILE_TYPE_LABELS = {
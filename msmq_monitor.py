@@ -10,38 +10,304 @@ import logging
 import re
 import json
 import os
+import base64
+import queue
+import threading
+import ctypes
+import time
+
+try:
+    import pythoncom
+    import win32com.client
+except ImportError:
+    # pywin32 is optional; queue data is then read through PowerShell
+    pythoncom = None
+    win32com = None
+
+try:
+    import orjson
+except ImportError:
+    # Optional: orjson parses PowerShell JSON output faster; fall back to the standard json module
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Operating system, determined once at import (it cannot change while running)
+SYSTEM = platform.system()
+
+# Timeout (seconds) for a single PowerShell command
+POWERSHELL_TIMEOUT = 10
+
+# Marker written by the PowerShell host after each command's output
+POWERSHELL_END_MARKER = '<<<END>>>'
+
+# Seconds a queue index built by refresh() is reused before enumerating queues again
+QUEUE_INDEX_TTL = 5
+
+# WMI namespace and performance counter class holding MSMQ queue message counts
+WMI_NAMESPACE = 'winmgmts:\\\\.\\root\\cimv2'
+MSMQ_QUEUE_WMI_CLASS = 'Win32_PerfRawData_MSMQ_MSMQQueue'
+
+# Separators in MSMQ queue names (computername\private$\queuename)
+QUEUE_PATH_SEPARATOR_RE = re.compile(r'[\\/]')
+
+# Native MSMQ management API (mqrt.dll) values used by MQMgmtGetInfo
+PROPID_MGMT_QUEUE_MESSAGE_COUNT = 7
+VT_NULL = 1
+VT_UI4 = 19
+
+
+def _loads_json(output):
+    """Parse PowerShell JSON output (orjson accepts str directly; both raise json.JSONDecodeError)"""
+    if orjson is not None:
+        return orjson.loads(output)
+    return json.loads(output)
+
+
+class MQPROPVARIANT_VALUE(ctypes.Union):
+    """Value union of MQPROPVARIANT; the counted-array member gives it its full size"""
+    _fields_ = [
+        ('ulVal', ctypes.c_ulong),
+        ('caub', ctypes.c_void_p * 2),  # CAUB: ULONG count + pointer
+    ]
+
+
+class MQPROPVARIANT(ctypes.Structure):
+    """ctypes layout of MQPROPVARIANT (PROPVARIANT) as far as needed for VT_UI4 values"""
+    _fields_ = [
+        ('vt', ctypes.c_ushort),
+        ('wReserved1', ctypes.c_ushort),
+        ('wReserved2', ctypes.c_ushort),
+        ('wReserved3', ctypes.c_ushort),
+        ('value', MQPROPVARIANT_VALUE),
+    ]
+
+
+class MQMGMTPROPS(ctypes.Structure):
+    """ctypes layout of MQMGMTPROPS"""
+    _fields_ = [
+        ('cProp', ctypes.c_ulong),
+        ('aPropID', ctypes.POINTER(ctypes.c_ulong)),
+        ('aPropVar', ctypes.POINTER(MQPROPVARIANT)),
+        ('aStatus', ctypes.POINTER(ctypes.c_long)),
+    ]
+
 
 class MSMQMonitor:
     """Monitor Windows Message Queues"""
     
     def __init__(self):
         """Initialize the MSMQ monitor"""
-        self.system = platform.system()
+        self.system = SYSTEM
         self.is_windows = self.system == 'Windows'
         
+        # Long-lived PowerShell host, so each poll does not pay powershell.exe startup
+        self._ps_process = None
+        self._ps_lines = None
+        self._ps_lock = threading.Lock()
+        self._msmq_available = None
+        
+        # PowerShell queries print tab-separated lines instead of ConvertTo-Json output
+        self._use_tsv = True
+        
+        # {simple queue name (lowercase): queue dict}, rebuilt by refresh()
+        self._index = {}
+        self._index_ts = 0
+        
+        # Direct WMI (COM) access via pywin32; COM objects are per thread
+        self._wmi_local = threading.local()
+        self._wmi_enabled = self.is_windows and win32com is not None
+        
+        # Native MSMQ runtime for single-queue lookups (MQMgmtGetInfo)
+        self._mqrt = None
+        if self.is_windows:
+            self._mqrt = self._load_mqrt()
+        
         if not self.is_windows:
             logger.warning("MSMQ monitoring is only available on Windows")
+        else:
+            if self._wmi_enabled and self._get_wmi() is None:
+                self._wmi_enabled = False
+            if not self._wmi_enabled:
+                # With WMI available the host is only started if a PowerShell fallback is needed
+                self._start_powershell_host()
+    
+    @staticmethod
+    def _load_mqrt():
+        """Load mqrt.dll and declare MQMgmtGetInfo; returns None if MSMQ is not installed"""
+        try:
+            mqrt = ctypes.WinDLL('mqrt.dll')
+            mqrt.MQMgmtGetInfo.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.POINTER(MQMGMTPROPS)]
+            mqrt.MQMgmtGetInfo.restype = ctypes.c_long
+            return mqrt
+        except Exception as e:
+            logger.info(f"Native MSMQ API not available, using queue enumeration: {str(e)}")
+            return None
+    
+    def _get_wmi(self):
+        """Return this thread's WMI connection, creating it on first use (None if unavailable)"""
+        wmi = getattr(self._wmi_local, 'wmi', None)
+        if wmi is None:
+            try:
+                # Every thread that uses COM must initialize it first
+                pythoncom.CoInitialize()
+                wmi = win32com.client.GetObject(WMI_NAMESPACE)
+                self._wmi_local.wmi = wmi
+            except Exception as e:
+                logger.warning(f"Could not connect to WMI, using PowerShell for MSMQ queries: {str(e)}")
+                return None
+        return wmi
+    
+    def _start_powershell_host(self):
+        """Start the persistent PowerShell host process (caller must hold _ps_lock or be in __init__)"""
+        try:
+            self._ps_process = subprocess.Popen(
+                ['powershell.exe', '-NoProfile', '-NonInteractive', '-Command', '-'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1
+            )
+            # Output is read on a helper thread so a hung command can time out
+            self._ps_lines = queue.Queue()
+            threading.Thread(
+                target=self._read_powershell_output,
+                args=(self._ps_process.stdout, self._ps_lines),
+                daemon=True
+            ).start()
+        except Exception as e:
+            logger.warning(f"Could not start persistent PowerShell host, falling back to per-call processes: {str(e)}")
+            self._ps_process = None
+            self._ps_lines = None
+    
+    @staticmethod
+    def _read_powershell_output(stream, lines):
+        """Forward PowerShell host output lines to a queue; None marks end of stream"""
+        try:
+            for line in stream:
+                lines.put(line.rstrip('\r\n'))
+        except Exception:
+            pass
+        lines.put(None)
+    
+    def _stop_powershell_host(self):
+        """Kill the persistent PowerShell host (caller must hold _ps_lock)"""
+        process = self._ps_process
+        self._ps_process = None
+        self._ps_lines = None
+        if process is not None:
+            try:
+                process.kill()
+                process.wait(timeout=5)
+            except Exception:
+                pass
+    
+    def close(self):
+        """Shut down the persistent PowerShell host"""
+        with self._ps_lock:
+            process = self._ps_process
+            if process is None:
+                return
+            try:
+                process.stdin.write('exit\n')
+                process.stdin.flush()
+                process.wait(timeout=5)
+                self._ps_process = None
+                self._ps_lines = None
+            except Exception:
+                self._stop_powershell_host()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    def _execute_in_host(self, command, on_line=None):
+        """
+        Run a command in the persistent PowerShell host.
+        Returns (handled, output): handled is False when the host is unavailable
+        If on_line is given, each output line is passed to it as it arrives instead of
+        being collected, and output is '' on success
+        """
+        with self._ps_lock:
+            if self._ps_process is None or self._ps_process.poll() is not None:
+                self._start_powershell_host()
+                if self._ps_process is None:
+                    return False, None
+            
+            # The script is sent as one base64 line; multi-line blocks are not
+            # reliably parsed when fed line by line to "-Command -"
+            encoded = base64.b64encode(command.encode('utf-8')).decode('ascii')
+            host_command = (
+                "$ok = $true; "
+                "try { Invoke-Expression ([Text.Encoding]::UTF8.GetString("
+                f"[Convert]::FromBase64String('{encoded}'))) | Out-String -Stream -Width 65536 }} "
+                "catch { $ok = $false; Write-Output ($_ | Out-String) }; "
+                f"Write-Output ('{POWERSHELL_END_MARKER}' + $ok)\n"
+            )
+            
+            try:
+                self._ps_process.stdin.write(host_command)
+                self._ps_process.stdin.flush()
+                
+                output_lines = []
+                while True:
+                    line = self._ps_lines.get(timeout=POWERSHELL_TIMEOUT)
+                    if line is None:
+                        logger.error("PowerShell host exited unexpectedly")
+                        self._stop_powershell_host()
+                        return True, None
+                    if line.startswith(POWERSHELL_END_MARKER):
+                        break
+                    if on_line is not None:
+                        on_line(line)
+                    else:
+                        output_lines.append(line)
+            except queue.Empty:
+                logger.error("PowerShell command timed out")
+                self._stop_powershell_host()
+                return True, None
+            except Exception as e:
+                logger.error(f"Error executing PowerShell command: {str(e)}")
+                self._stop_powershell_host()
+                return True, None
+            
+            output = '\n'.join(output_lines).strip()
+            if line[len(POWERSHELL_END_MARKER):] != 'True':
+                logger.error(f"PowerShell command failed: {output}")
+                return True, None
+            return True, output
     
-    def _execute_powershell(self, command):
-        """Execute a PowerShell command and return the result"""
+    def _execute_powershell(self, command, on_line=None):
+        """
+        Execute a PowerShell command and return the result
+        With on_line, output lines are streamed to that callback and '' is returned on success
+        """
         if not self.is_windows:
             return None
         
+        handled, output = self._execute_in_host(command, on_line)
+        if handled:
+            return output
+        
         try:
-            # Use PowerShell to execute the command
-            ps_command = f'powershell.exe -Command "{command}"'
+            # Use PowerShell to execute the command; an argv list avoids an extra cmd.exe
+            # and passes the script as one argument without shell quoting
             result = subprocess.run(
-                ps_command,
-                shell=True,
+                ['powershell.exe', '-NoProfile', '-NonInteractive', '-Command', command],
+                shell=False,
                 capture_output=True,
                 text=True,
-                timeout=10
+                timeout=POWERSHELL_TIMEOUT
             )
             
             if result.returncode == 0:
+                if on_line is not None:
+                    for line in result.stdout.splitlines():
+                        on_line(line)
+                    return ''
                 return result.stdout.strip()
             else:
                 logger.error(f"PowerShell command failed: {result.stderr}")
@@ -53,126 +319,276 @@ class MSMQMonitor:
             logger.error(f"Error executing PowerShell command: {str(e)}")
             return None
     
-    def get_all_queues(self):
+    def _build_queue_name_filter(self, filter_names):
+        """
+        Build the PowerShell snippet that defines $names for queue filtering.
+        Names are compared without path prefix and extension; -contains is case-insensitive.
+        """
+        if not filter_names:
+            return "$names = $null"
+        
+        names = sorted({os.path.splitext(name)[0] for name in filter_names if name})
+        # Quote each name as a PowerShell single-quoted string literal
+        quoted_names = ','.join("'" + name.replace("'", "''") + "'" for name in names)
+        return f"$names = @({quoted_names})"
+    
+    def get_all_queues(self, filter_names=None):
         """
         Get all MSMQ queues with their message counts
         Returns a list of dictionaries with queue information
+        
+        Args:
+            filter_names: Optional executable/queue names. When given, PowerShell only returns
+                queues whose simple name (without extension) matches one of these names
         """
         if not self.is_windows:
             return []
         
+        # Read the MSMQ performance counters directly when pywin32 is available
+        queues = self._get_queues_wmi_com(filter_names)
+        if queues is not None:
+            return queues
+        
         queues = []
         
         try:
             # Get all queues using PowerShell Get-MsmqQueue cmdlet
             # This requires MSMQ PowerShell module to be installed
-            ps_command = """
+            ps_command = self._build_queue_name_filter(filter_names) + """
             $queues = Get-MsmqQueue -QueueType Private, Public -ErrorAction SilentlyContinue
             $result = @()
             foreach ($queue in $queues) {
-                $queueInfo = @{
-                    Name = $queue.Name
-                    MessageCount = $queue.MessageCount
-                    QueueType = $queue.QueueType
-                    Path = $queue.Path
-                }
-                $result += $queueInfo
+                """ + self._queue_name_filter_statement('$queue.Name') + """
+                """ + self._queue_output_statement('$queue.Name', '$queue.MessageCount', '$queue.QueueType', '$queue.Path') + """
             }
-            $result | ConvertTo-Json -Compress
-            """
-            
-            output = self._execute_powershell(ps_command)
+            """ + self._queue_output_finish()
             
-            if output:
-                try:
-                    queues_data = json.loads(output)
-                    if isinstance(queues_data, list):
-                        queues = queues_data
-                    elif isinstance(queues_data, dict):
-                        queues = [queues_data]
-                except json.JSONDecodeError:
-                    logger.warning("Failed to parse PowerShell JSON output")
-                    # Fallback: try parsing manually
-                    queues = self._parse_queue_output_manual(output)
+            if self._use_tsv:
+                # Parse queue lines as the host produces them instead of buffering the whole output
+                streamed_queues = []
+                output = self._execute_powershell(ps_command, on_line=lambda line: self._add_queue_line(line, streamed_queues))
+                if output is not None:
+                    queues = streamed_queues
+            else:
+                output = self._execute_powershell(ps_command)
+                
+                if output:
+                    try:
+                        queues_data = _loads_json(output)
+                        if isinstance(queues_data, list):
+                            queues = queues_data
+                        elif isinstance(queues_data, dict):
+                            queues = [queues_data]
+                    except json.JSONDecodeError:
+                        logger.warning("Failed to parse PowerShell JSON output")
+                        # Fallback: try parsing manually
+                        queues = self._parse_queue_output_manual(output)
         except Exception as e:
             logger.error(f"Error getting MSMQ queues: {str(e)}")
             # Try alternative method using WMI
-            queues = self._get_queues_wmi()
+            queues = self._get_queues_wmi(filter_names)
         
         return queues
     
-    def _get_queues_wmi(self):
+    def _get_queues_wmi_com(self, filter_names=None):
+        """
+        Get queues from the MSMQ WMI performance counters through COM (pywin32)
+        Returns a list of queue dictionaries, or None if direct WMI access is unavailable
+        """
+        if not self._wmi_enabled:
+            return None
+        
+        wmi = self._get_wmi()
+        if wmi is None:
+            return None
+        
+        names = None
+        if filter_names:
+            names = {os.path.splitext(name)[0].lower() for name in filter_names if name}
+        
+        queues = []
+        try:
+            for queue_obj in wmi.InstancesOf(MSMQ_QUEUE_WMI_CLASS):
+                queue_name = queue_obj.Name
+                message_count = queue_obj.MessagesInQueue
+                if not queue_name or message_count is None:
+                    continue
+                if names:
+                    simple_name = re.split(r'[\\/]', queue_name)[-1].replace('$', '')
+                    if os.path.splitext(simple_name)[0].lower() not in names:
+                        continue
+                queues.append({
+                    'Name': queue_name,
+                    'MessageCount': int(message_count),
+                    'QueueType': 'Private' if 'private$' in queue_name.lower() else 'Unknown',
+                    'Path': ''
+                })
+        except Exception as e:
+            logger.error(f"Error getting queues via WMI COM: {str(e)}")
+            return None
+        
+        return queues
+    
+    def _get_queues_wmi(self, filter_names=None):
         """Alternative method: Get queues using WMI"""
+        queues = self._get_queues_wmi_com(filter_names)
+        if queues is not None:
+            return queues
+        
         queues = []
         
         try:
             # Use WMI to get queue information
-            ps_command = """
+            ps_command = self._build_queue_name_filter(filter_names) + """
             $queues = Get-WmiObject -Class Win32_PerfRawData_MSMQ_MSMQQueue -ErrorAction SilentlyContinue
             $result = @()
             foreach ($queue in $queues) {
                 $queueName = $queue.Name
                 $messageCount = $queue.MessagesInQueue
+                """ + self._queue_name_filter_statement('$queueName') + """
                 if ($queueName -and $messageCount -ge 0) {
-                    $queueInfo = @{
-                        Name = $queueName
-                        MessageCount = $messageCount
-                        QueueType = "Unknown"
-                        Path = ""
-                    }
-                    $result += $queueInfo
+                    """ + self._queue_output_statement('$queueName', '$messageCount', "'Unknown'", "''") + """
                 }
             }
-            $result | ConvertTo-Json -Compress
-            """
+            """ + self._queue_output_finish()
             
-            output = self._execute_powershell(ps_command)
-            
-            if output:
-                try:
-                    queues_data = json.loads(output)
-                    if isinstance(queues_data, list):
-                        queues = queues_data
-                    elif isinstance(queues_data, dict):
-                        queues = [queues_data]
-                except json.JSONDecodeError:
-                    logger.warning("Failed to parse WMI JSON output")
+            if self._use_tsv:
+                # Parse queue lines as the host produces them instead of buffering the whole output
+                streamed_queues = []
+                output = self._execute_powershell(ps_command, on_line=lambda line: self._add_queue_line(line, streamed_queues))
+                if output is not None:
+                    queues = streamed_queues
+            else:
+                output = self._execute_powershell(ps_command)
+                
+                if output:
+                    try:
+                        queues_data = _loads_json(output)
+                        if isinstance(queues_data, list):
+                            queues = queues_data
+                        elif isinstance(queues_data, dict):
+                            queues = [queues_data]
+                    except json.JSONDecodeError:
+                        logger.warning("Failed to parse WMI JSON output")
         except Exception as e:
             logger.error(f"Error getting queues via WMI: {str(e)}")
         
         return queues
     
+    def _queue_name_filter_statement(self, name):
+        """
+        PowerShell statement that skips the current queue when $names is set and the simple
+        name of the given expression (last path segment without '$' and extension) is not in it
+        Raw strings, so PowerShell receives the regex backslashes exactly as written
+        """
+        return (
+            r"if ($names -and " + name + r") { "
+            r"$simpleName = ((" + name + r" -split '[\\/]')[-1] -replace '\$', '') -replace '\.[^.]*$', ''; "
+            r"if ($names -notcontains $simpleName) { continue } }"
+        )
+    
+    def _queue_output_statement(self, name, message_count, queue_type, path):
+        """
+        PowerShell statement that outputs one queue from the given expressions:
+        a tab-separated line, or (JSON mode) a hashtable appended to $result
+        """
+        if self._use_tsv:
+            return f'"$({name})`t$({message_count})`t$({queue_type})`t$({path})"'
+        return f'$result += @{{ Name = {name}; MessageCount = {message_count}; QueueType = {queue_type}; Path = {path} }}'
+    
+    def _queue_output_finish(self):
+        """PowerShell statement that ends a queue query (JSON mode serializes $result)"""
+        if self._use_tsv:
+            return ''
+        return '$result | ConvertTo-Json -Compress'
+    
+    def _add_queue_line(self, line, queues):
+        """
+        Parse one tab-separated queue line (Name, MessageCount, QueueType, Path) into queues
+        Lines that are not queue lines are skipped
+        """
+        fields = line.split('\t', 3)
+        if len(fields) < 2 or not fields[0]:
+            return
+        try:
+            message_count = int(fields[1])
+        except ValueError:
+            return
+        queues.append({
+            'Name': fields[0],
+            'MessageCount': message_count,
+            'QueueType': fields[2] if len(fields) > 2 and fields[2] else 'Unknown',
+            'Path': fields[3] if len(fields) > 3 else ''
+        })
+    
     def _parse_queue_output_manual(self, output):
-        """Manual parsing fallback if JSON parsing fails"""
+        """Manual parsing fallback if JSON parsing fails (tab-separated queue lines)"""
         queues = []
-        # This is a fallback - would need to parse text output
-        # For now, return empty list
+        for line in output.splitlines():
+            self._add_queue_line(line, queues)
         return queues
     
+    def refresh(self, ttl=QUEUE_INDEX_TTL):
+        """
+        Enumerate queues once and rebuild the name index, unless it is younger than ttl seconds
+        Returns the current index {simple queue name (lowercase): queue dict}
+        """
+        if self._index_ts and time.monotonic() - self._index_ts < ttl:
+            return self._index
+        
+        index = self._build_queue_index(self.get_all_queues())
+        
+        # Swap in a complete index so concurrent readers never see a partial one
+        self._index = index
+        self._index_ts = time.monotonic()
+        return index
+    
+    def _build_queue_index(self, queues):
+        """Map simple queue names (lowercase, with and without extension) to queue dicts"""
+        index = {}
+        for queue_info in queues:
+            simple_name = self.extract_queue_simple_name(queue_info.get('Name', '')).lower()
+            if not simple_name:
+                continue
+            index.setdefault(simple_name, queue_info)
+            # Also allow lookups without an extension (queues are named after executables)
+            index.setdefault(os.path.splitext(simple_name)[0], queue_info)
+        return index
+    
+    def get_queue_message_counts(self, names):
+        """
+        Get message counts for several queues with a single enumeration
+        Returns {name: message count} for each requested name that has a matching queue
+        """
+        names = [name for name in names if name]
+        if not names:
+            return {}
+        
+        index = self._build_queue_index(self.get_all_queues(filter_names=names))
+        counts = {}
+        for name in names:
+            lookup_name = name.lower()
+            queue_info = index.get(lookup_name)
+            if queue_info is None:
+                queue_info = index.get(os.path.splitext(lookup_name)[0])
+            if queue_info is not None:
+                counts[name] = queue_info.get('MessageCount', 0)
+        return counts
+    
     def get_queue_by_name(self, queue_name):
         """
         Get a specific queue by name
         Returns queue info dict or None
         """
-        all_queues = self.get_all_queues()
-        
-        for queue in all_queues:
-            # Queue name might be in format: "computername\\private$\\queuename"
-            # or just "queuename"
-            queue_display_name = queue.get('Name', '')
-            
-            # Extract just the queue name (last part after \\)
-            if '\\' in queue_display_name:
-                queue_name_parts = queue_display_name.split('\\')
-                queue_simple_name = queue_name_parts[-1]
-            else:
-                queue_simple_name = queue_display_name
-            
-            # Compare (case-insensitive, without extension)
-            if queue_simple_name.lower() == queue_name.lower():
-                return queue
+        if not queue_name:
+            return None
         
-        return None
+        index = self.refresh()
+        queue_name = queue_name.lower()
+        queue_info = index.get(queue_name)
+        if queue_info is None:
+            queue_info = index.get(os.path.splitext(queue_name)[0])
+        return queue_info
     
     def extract_queue_simple_name(self, queue_name):
         """
@@ -188,30 +604,28 @@ class MSMQMonitor:
         if not queue_name:
             return ''
         
-        # Remove common prefixes
-        queue_name = queue_name.replace('private$\\', '').replace('public$\\', '')
-        queue_name = queue_name.replace(r'private$/', '').replace(r'public$/', '')
-        
-        # Extract last part after backslash (for private queues: computername\private$\queuename)
-        if '\\' in queue_name:
-            parts = queue_name.split('\\')
-            # Find the actual queue name (usually the last non-empty part)
-            for part in reversed(parts):
-                if part and part.lower() not in ['private$', 'public$']:
-                    return part
-            # Fallback: use last part
-            queue_name = parts[-1]
-        elif '/' in queue_name:
-            parts = queue_name.split('/')
-            for part in reversed(parts):
-                if part and part.lower() not in ['private$', 'public$']:
-                    return part
-            queue_name = parts[-1]
-        
-        # Remove any remaining $ signs
-        queue_name = queue_name.replace('$', '')
-        
-        return queue_name.strip()
+        # The queue name is the last non-empty path part that is not the private$/public$ marker
+        for part in reversed(QUEUE_PATH_SEPARATOR_RE.split(queue_name)):
+            if part and part.lower() not in ('private$', 'public$'):
+                # Remove any remaining $ signs
+                return part.replace('$', '').strip()
+        
+        return ''
+    
+    def build_exe_index(self, executable_files):
+        """
+        Build a lookup of executables by lowercase file name without extension
+        Build it once and pass it to match_queue_to_executable for every queue
+        
+        Returns:
+            Dict of {name_without_extension_lower: executable file path or name}
+        """
+        exe_index = {}
+        for exe_file in executable_files:
+            exe_name_without_ext = os.path.splitext(os.path.basename(exe_file))[0].lower()
+            # Keep the first executable for a name, as the previous linear scan did
+            exe_index.setdefault(exe_name_without_ext, exe_file)
+        return exe_index
     
     def match_queue_to_executable(self, queue_name, executable_files):
         """
@@ -220,7 +634,7 @@ class MSMQMonitor:
         
         Args:
             queue_name: Name of the MSMQ queue
-            executable_files: List of executable file paths or names
+            executable_files: Index from build_exe_index, or a list of executable file paths or names
         
         Returns:
             Matched executable file path or None
@@ -231,46 +645,89 @@ class MSMQMonitor:
         if not queue_simple_name:
             return None
         
-        # Remove extension if present
-        queue_simple_name = os.path.splitext(queue_simple_name)[0]
-        
-        for exe_file in executable_files:
-            # Get just the filename without path
-            if os.path.sep in exe_file:
-                exe_filename = os.path.basename(exe_file)
-            else:
-                exe_filename = exe_file
-            
-            # Get filename without extension
-            exe_name_without_ext = os.path.splitext(exe_filename)[0]
-            
-            # Compare (case-insensitive)
-            if exe_name_without_ext.lower() == queue_simple_name.lower():
-                logger.debug(f"Matched queue '{queue_name}' (simple: '{queue_simple_name}') to executable '{exe_file}'")
-                return exe_file
+        exe_index = executable_files
+        if not isinstance(exe_index, dict):
+            exe_index = self.build_exe_index(executable_files)
         
-        return None
+        # Compare without extension (case-insensitive)
+        exe_file = exe_index.get(os.path.splitext(queue_simple_name)[0].lower())
+        if exe_file:
+            logger.debug(f"Matched queue '{queue_name}' (simple: '{queue_simple_name}') to executable '{exe_file}'")
+        return exe_file
     
     def get_queue_message_count(self, queue_name):
         """
         Get message count for a specific queue
         Returns message count (int) or None if queue not found
         """
+        # One MQMgmtGetInfo call for this queue instead of enumerating every queue
+        message_count = self._get_queue_message_count_native(queue_name)
+        if message_count is not None:
+            return message_count
+        
         queue = self.get_queue_by_name(queue_name)
         if queue:
             return queue.get('MessageCount', 0)
         return None
     
+    def _get_queue_message_count_native(self, queue_name):
+        """
+        Get a private queue's message count with MQMgmtGetInfo (PROPID_MGMT_QUEUE_MESSAGE_COUNT)
+        Returns message count (int) or None if the native API is unavailable or the call fails
+        """
+        if self._mqrt is None:
+            return None
+        
+        simple_name = self.extract_queue_simple_name(queue_name)
+        if not simple_name:
+            return None
+        
+        prop_ids = (ctypes.c_ulong * 1)(PROPID_MGMT_QUEUE_MESSAGE_COUNT)
+        prop_vars = (MQPROPVARIANT * 1)()
+        prop_vars[0].vt = VT_NULL
+        statuses = (ctypes.c_long * 1)()
+        props = MQMGMTPROPS(1, prop_ids, prop_vars, statuses)
+        
+        try:
+            hr = self._mqrt.MQMgmtGetInfo(None, f"queue=Direct=OS:.\\private$\\{simple_name}", ctypes.byref(props))
+        except Exception as e:
+            logger.error(f"Error calling MQMgmtGetInfo for queue '{simple_name}': {str(e)}")
+            return None
+        
+        # Failure HRESULTs are negative; e.g. MQ_ERROR_QUEUE_NOT_ACTIVE for queues not opened yet
+        if hr < 0 or prop_vars[0].vt != VT_UI4:
+            return None
+        return prop_vars[0].value.ulVal
+    
     def is_msmq_available(self):
         """Check if MSMQ is available on this system"""
         if not self.is_windows:
             return False
         
+        # MSMQ feature presence does not change at runtime
+        if self._msmq_available is not None:
+            return self._msmq_available
+        
+        if self._wmi_enabled:
+            wmi = self._get_wmi()
+            if wmi is not None:
+                try:
+                    # The MSMQ counter class only exists when the MSMQ feature is installed
+                    wmi.Get(MSMQ_QUEUE_WMI_CLASS)
+                    self._msmq_available = True
+                except Exception:
+                    self._msmq_available = False
+                return self._msmq_available
+        
         try:
             # Try to execute a simple PowerShell command to check MSMQ
             ps_command = "Get-Command Get-MsmqQueue -ErrorAction SilentlyContinue | Select-Object -ExpandProperty Name"
             result = self._execute_powershell(ps_command)
-            return result is not None and 'Get-MsmqQueue' in result
+            if result is None:
+                # Command did not complete; do not cache so a later call can retry
+                return False
+            self._msmq_available = 'Get-MsmqQueue' in result
+            return self._msmq_available
         except Exception:
             return False
 
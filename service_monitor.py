@@ -8,19 +8,214 @@ import subprocess
 import os
 import platform
 import logging
-from datetime import datetime
+import re
+import shlex
 import json
 import stat
+import time
+import functools
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Operating system, determined once at import (it cannot change while running)
+SYSTEM = platform.system()
+
 # Supported file extensions by OS
 SUPPORTED_EXTENSIONS = {
-    'Windows': ['.jar', '.exe', '.bat'],
-    'Darwin': ['.jar', '.sh'],  # macOS
-    'Linux': ['.jar', '.sh']
+    'Windows': frozenset({'.jar', '.exe', '.bat'}),
+    'Darwin': frozenset({'.jar', '.sh'}),  # macOS
+    'Linux': frozenset({'.jar', '.sh'})
+}
+# Extensions used on any other OS
+ALL_EXTENSIONS = frozenset({'.jar', '.exe', '.bat', '.sh'})
+
+# Command line suffixes of executable (non-JAR) services, in one tuple for str.endswith
+SERVICE_FILE_EXTENSIONS = ('.exe', '.bat', '.sh')
+
+# File type reported for each service file extension
+FILE_TYPES = {'.jar': 'JAR', '.exe': 'EXE', '.bat': 'BAT', '.sh': 'SH'}
+
+# Shortest window a non-blocking CPU reading may cover. A process object sampled more recently
+# than this (e.g. by a scan moments earlier) reads 0% or a spike, so it gets a fresh sample instead
+MIN_CPU_SAMPLE_INTERVAL = 0.1
+
+# Seconds to wait for a service to exit after terminate(), and after kill()
+STOP_TIMEOUT = 10
+KILL_TIMEOUT = 5
+# Finished background stops kept for get_stop_status before they are pruned
+MAX_PENDING_STOPS = 100
+
+# Windows process creation flags for started services: DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP
+WINDOWS_DETACHED_FLAGS = 0x00000008 | 0x00000200
+
+# Start errors for service file types that only run on another OS (see ServiceMonitor._command_builders)
+PLATFORM_ONLY_ERRORS = {
+    '.bat': 'BAT files are only supported on Windows',
+    '.sh': 'SH files are not supported on Windows',
 }
 
+# Seconds a waiting caller watches a launched service for an early exit (start failure);
+# long enough for a JVM or .NET service to fail, and cut short as soon as it does exit
+START_CHECK_TIMEOUT = 1
+# Seconds a background start watcher waits for an exit before reporting the start as successful
+START_WATCH_TIMEOUT = 2
+# Finished background starts kept for get_start_status before they are pruned
+MAX_PENDING_STARTS = 100
+
+# Seconds after which processes found not to be services are probed again (macOS/Linux only):
+# a process that execs another program keeps its pid and create time, so its cache key
+NON_SERVICE_RECHECK_INTERVAL = 30
+
+# Windows System Idle Process and System: never services, and their command lines are not readable
+WINDOWS_SYSTEM_PIDS = frozenset({0, 4})
+
+# Threads reading command lines of newly seen processes in parallel (Windows only, see _probe_new_processes)
+PROBE_WORKER_COUNT = min(32, (os.cpu_count() or 1) * 4)
+
+# Port number patterns in service file names, tried in order: _8080, -8080, Port8080
+PORT_FILENAME_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'_(\d+)',
+    r'-(\d+)',
+    r'Port(\d+)',
+))
+# Running services also fall back to any number in the file name (last resort)
+PORT_IDENTIFIER_PATTERNS = PORT_FILENAME_PATTERNS + (re.compile(r'(\d+)'),)
+
+# Port argument patterns in command lines: --port=8080, -p 8080, --server.port=8080, port=8080
+PORT_CMDLINE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'--port[=:](\d+)',
+    r'-p\s+(\d+)',
+    r'--server\.port[=:](\d+)',
+    r'port[=:](\d+)',
+))
+
+# Column order of get_all_services_columnar rows
+SERVICE_COLUMNS = ('pid', 'jar_name', 'status', 'cpu_percent', 'memory_mb', 'uptime_seconds', 'start_time')
+
+
+@functools.lru_cache(maxsize=1024)
+def extract_port_from_filename(filename, any_number=True):
+    """
+    Extract a port number from a file name (MyApp_8080.exe, MyApp-8081.jar, MyApp_Port8082.exe),
+    falling back to any number in the name if any_number is set. Returns the port as a string or None.
+    Results are cached: the same few service file names are seen on every scan.
+    """
+    if not filename:
+        return None
+    
+    for pattern in PORT_IDENTIFIER_PATTERNS if any_number else PORT_FILENAME_PATTERNS:
+        match = pattern.search(filename)
+        if match:
+            port = match.group(1)
+            # Only return if it looks like a port (reasonable range)
+            if port.isdigit() and 1 <= int(port) <= 65535:
+                return port
+    return None
+
+
+class ServiceProbe:
+    """
+    What a service process's command line says about it; fixed for the life of the process
+    unless it execs another program (process_name, read at probe time, then changes)
+    """
+    
+    __slots__ = ('service_path', 'service_name', 'file_type', 'cmdline', 'cmdline_str', 'port_identifier',
+                 'process_name')
+    
+    def __init__(self, service_path, service_name, file_type, cmdline, cmdline_str, port_identifier,
+                 process_name):
+        self.service_path = service_path
+        self.service_name = service_name
+        self.file_type = file_type
+        self.cmdline = cmdline
+        self.cmdline_str = cmdline_str
+        self.port_identifier = port_identifier
+        self.process_name = process_name
+
+
+class ServiceUsage:
+    """CPU and memory usage of a running service, as sampled by get_many_details"""
+    
+    __slots__ = ('pid', 'service_name', 'service_path', 'file_type', 'cpu_percent', 'memory_mb')
+    
+    def __init__(self, pid, service_name, service_path, file_type, cpu_percent, memory_mb):
+        self.pid = pid
+        self.service_name = service_name
+        self.service_path = service_path
+        self.file_type = file_type
+        self.cpu_percent = cpu_percent
+        self.memory_mb = memory_mb
+    
+    @property
+    def jar_name(self):
+        """Alias of service_name (kept for backward compatibility)"""
+        return self.service_name
+    
+    def to_dict(self):
+        """Return the usage as a dict (same keys as get_service_details)"""
+        return {
+            'pid': self.pid,
+            'service_name': self.service_name,
+            'jar_name': self.service_name,  # Keep for backward compatibility
+            'service_path': self.service_path,
+            'file_type': self.file_type,
+            'cpu_percent': self.cpu_percent,
+            'memory_mb': self.memory_mb
+        }
+
+
+class ServiceInfo:
+    """A running service and its utilization, as found by iter_service_infos"""
+    
+    __slots__ = ('pid', 'service_name', 'process_name', 'service_path', 'file_type', 'status',
+                 'cpu_percent', 'memory_mb', 'uptime_seconds', 'uptime_formatted', 'start_time',
+                 'port_identifier', 'cmdline')
+    
+    def __init__(self, pid, service_name, process_name, service_path, file_type, status,
+                 cpu_percent, memory_mb, uptime_seconds, uptime_formatted, start_time,
+                 port_identifier, cmdline):
+        self.pid = pid
+        self.service_name = service_name
+        self.process_name = process_name  # Actual process name (e.g., "CorrelatorMax.exe")
+        self.service_path = service_path
+        self.file_type = file_type
+        self.status = status
+        self.cpu_percent = cpu_percent
+        self.memory_mb = memory_mb
+        self.uptime_seconds = uptime_seconds
+        self.uptime_formatted = uptime_formatted
+        self.start_time = start_time
+        self.port_identifier = port_identifier  # Port number or identifier (e.g., "8080")
+        self.cmdline = cmdline  # Full command line for debugging/matching
+    
+    @property
+    def jar_name(self):
+        """Alias of service_name (kept for backward compatibility)"""
+        return self.service_name
+    
+    def to_dict(self):
+        """Return the service as a dict (same keys as get_all_services entries)"""
+        return {
+            'pid': self.pid,
+            'service_name': self.service_name,
+            'jar_name': self.service_name,  # Keep for backward compatibility
+            'process_name': self.process_name,
+            'service_path': self.service_path,
+            'jar_path': self.service_path,  # Keep for backward compatibility
+            'file_type': self.file_type,
+            'status': self.status,
+            'cpu_percent': self.cpu_percent,
+            'memory_mb': self.memory_mb,
+            'uptime_seconds': self.uptime_seconds,
+            'uptime_formatted': self.uptime_formatted,
+            'start_time': self.start_time,
+            'port_identifier': self.port_identifier,
+            'cmdline': self.cmdline
+        }
+
 
 class ServiceMonitor:
     """Monitor and control services (JAR, EXE, BAT, SH files)"""
@@ -28,60 +223,251 @@ class ServiceMonitor:
     def __init__(self):
         """Initialize the service monitor"""
         self.processes = []
-        self.system = platform.system()
+        self.system = SYSTEM
+        self._supported_extensions = SUPPORTED_EXTENSIONS.get(self.system, ALL_EXTENSIONS)
+        # Processes sampled by the last get_many_details call, reused so their
+        # CPU counters measure usage since that call without blocking. They are created
+        # with psutil.Process(pid), never taken from process_iter (which hands every caller
+        # the same cached objects), so no other reader moves their CPU baseline
+        self._usage_processes = {}  # {pid: psutil.Process}
+        self._usage_sampled_at = 0.0  # time.monotonic() of the last get_many_details readings
+        # Service processes found by the last get_all_services scan, kept for the same reason
+        self._scan_processes = {}  # {pid: psutil.Process}
+        self._scan_sampled_at = 0.0  # time.monotonic() of the last scan's readings
+        # Processes sampled by get_service_details, kept apart from the scan's for the same reason
+        self._detail_processes = {}  # {pid: (psutil.Process, time.monotonic() of its last CPU reading)}
+        # Service detection results per process, so unchanged processes are not
+        # re-read on every scan; keyed by create time as well to survive PID reuse
+        self._service_probe_cache = {}  # {(pid, create_time): ServiceProbe or None}
+        # On macOS/Linux a process can exec another program under the same key, so cached
+        # "not a service" results are dropped every NON_SERVICE_RECHECK_INTERVAL seconds
+        # and a scan re-probes a service whose process name has changed
+        self._recheck_probes = self.system != 'Windows'
+        self._non_services_checked_at = time.monotonic()
+        # Formatted start times; a process's create time never changes
+        self._start_time_cache = {}  # {(pid, create_time): 'YYYY-MM-DD HH:MM:SS'}
+        # Background confirmation of non-blocking stops (terminate, wait, kill if needed)
+        self._stop_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='stop')
+        self._pending_stops = {}  # {pid: Future of the stop result}
+        self._pending_stops_lock = threading.Lock()
+        # Background confirmation of non-blocking starts (watch for an early exit)
+        self._start_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='start')
+        self._pending_starts = {}  # {pid: Future of the start result}
+        self._pending_starts_lock = threading.Lock()
+        # PIDs rejected before any system call (a blanket low-PID cutoff would hide a
+        # service running as PID 1 in a Linux container, so only Windows has fixed PIDs)
+        self._skipped_pids = WINDOWS_SYSTEM_PIDS if self.system == 'Windows' else frozenset()
+        self._probe_executor = None
+        if SYSTEM == 'Windows':
+            self._probe_executor = ThreadPoolExecutor(max_workers=PROBE_WORKER_COUNT, thread_name_prefix='probe')
+        # Start command builders for the file types this OS can run, chosen once
+        self._command_builders = {
+            '.jar': self._build_jar_command,
+            '.exe': self._build_exe_command,
+        }
+        if self.system == 'Windows':
+            self._command_builders['.bat'] = self._build_bat_command
+        else:
+            self._command_builders['.sh'] = self._build_sh_command
     
     def _get_supported_extensions(self):
         """Get supported file extensions for current OS"""
-        return SUPPORTED_EXTENSIONS.get(self.system, ['.jar', '.exe', '.bat', '.sh'])
+        return self._supported_extensions
     
     def _is_service_process(self, process):
         """Check if a process is a monitored service (JAR, EXE, BAT, SH)"""
         try:
-            cmdline = process.cmdline()
-            if not cmdline:
-                return False
-            
-            exe_path = cmdline[0].lower()
-            
-            # Check for Java JAR processes
-            if 'java' in exe_path or 'javaw' in exe_path:
-                for arg in cmdline:
-                    if arg.endswith('.jar'):
-                        return True
-            
-            # Check for executable files (.exe, .bat, .sh)
-            for ext in ['.exe', '.bat', '.sh']:
-                if exe_path.endswith(ext) or any(arg.endswith(ext) for arg in cmdline):
-                    return True
-            
-            return False
+            return self._is_service_cmdline(process.cmdline())
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             return False
     
+    def _is_service_cmdline(self, cmdline):
+        """Check if a command line belongs to a monitored service (JAR, EXE, BAT, SH)"""
+        return self._classify_cmdline(cmdline) is not None
+    
     def _get_service_path(self, process):
         """Extract service file path from process command line"""
         try:
-            cmdline = process.cmdline()
-            exe_path = cmdline[0]
-            
-            # Check for JAR files
-            for arg in cmdline:
-                if arg.endswith('.jar'):
-                    return arg
-            
-            # Check for executable files
-            for ext in ['.exe', '.bat', '.sh']:
-                if exe_path.endswith(ext):
-                    return exe_path
-                for arg in cmdline:
-                    if arg.endswith(ext):
-                        return arg
-            
-            # Return executable path as fallback
-            return exe_path
+            return self._service_path_from_cmdline(process.cmdline())
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return None
     
+    def _service_path_from_cmdline(self, cmdline):
+        """Extract service file path from a command line"""
+        classified = self._classify_cmdline(cmdline)
+        return classified[0] if classified else cmdline[0]
+    
+    def _classify_cmdline(self, cmdline):
+        """
+        Detect a monitored service, its file path and file type in one pass over a command line
+        Returns (service_path, file_type) for a service (JAR, EXE, BAT, SH), otherwise None
+        Extensions match in any case (Windows paths such as C:\\SVC\\APP.EXE are common)
+        """
+        if not cmdline:
+            return None
+        
+        exe_path = cmdline[0]
+        jar_path = None  # First .jar argument
+        jar_flag_arg = None  # Argument after the first -jar (the usual "java [options] -jar <file>.jar")
+        exec_path = None  # First .exe/.bat/.sh argument (including the executable itself)
+        previous = None
+        for arg in cmdline:
+            if previous == '-jar' and jar_flag_arg is None:
+                jar_flag_arg = arg
+            arg_lower = arg.lower()
+            if arg_lower.endswith('.jar'):
+                if jar_path is None:
+                    jar_path = arg
+            elif exec_path is None and arg_lower.endswith(SERVICE_FILE_EXTENSIONS):
+                exec_path = arg
+            previous = arg
+        
+        # Java JAR processes ('java' also covers javaw) or executable files (.exe, .bat, .sh)
+        is_jar_service = jar_path is not None and 'java' in exe_path.lower()
+        if not (is_jar_service or exec_path is not None):
+            return None
+        
+        if jar_flag_arg is not None and jar_flag_arg.lower().endswith('.jar'):
+            service_path = jar_flag_arg
+        else:
+            service_path = jar_path or exec_path or exe_path
+        return service_path, self._get_file_type(service_path)
+    
+    def _probe_service(self, process, refresh=False):
+        """
+        Return a ServiceProbe if the process is a monitored service, otherwise None
+        The command line is read and parsed (path, name, file type, port) once per
+        process (pid + create time) and the result cached; refresh=True reads it again
+        """
+        if process.pid in self._skipped_pids:
+            return None
+        
+        try:
+            key = (process.pid, process.create_time())
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+        
+        if not refresh:
+            try:
+                return self._service_probe_cache[key]
+            except KeyError:
+                pass
+        
+        try:
+            cmdline = process.cmdline()
+        except psutil.AccessDenied:
+            # Not readable now means not readable later; remember it as "not a service"
+            cmdline = []
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            return None
+        
+        result = None
+        classified = self._classify_cmdline(cmdline)
+        if classified:
+            service_path, file_type = classified
+            service_name = self._get_service_name(service_path)
+            cmdline_str = ' '.join(cmdline)
+            try:
+                process_name = process.name()
+            except psutil.AccessDenied:
+                process_name = ''
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                return None
+            result = ServiceProbe(
+                service_path=service_path,
+                service_name=service_name,
+                file_type=file_type,
+                cmdline=cmdline,
+                cmdline_str=cmdline_str,
+                # Use port from filename first, then cmdline
+                port_identifier=self._extract_port_or_identifier(service_name) or self._extract_port_from_cmdline(cmdline_str),
+                process_name=process_name
+            )
+        self._service_probe_cache[key] = result
+        return result
+    
+    def _get_process(self, pid):
+        """
+        Return (psutil.Process, known) for pid, reusing the object kept by the last scan when
+        it is still the same process (psutil's cached fields stay warm); not for CPU sampling,
+        which each reader does on its own objects
+        known is True for a reused object; raises psutil.NoSuchProcess if pid is not running
+        """
+        proc = psutil.Process(pid)
+        known_proc = self._scan_processes.get(pid) or self._usage_processes.get(pid)
+        # psutil.Process equality also compares create time, so a reused PID is treated as new
+        if known_proc is not None and known_proc == proc:
+            return known_proc, True
+        return proc, False
+    
+    def _probe_new_processes(self, procs):
+        """
+        Probe processes missing from the probe cache in parallel (Windows only)
+        Reading another process's command line is a slow, GIL-releasing system call on Windows,
+        so the reads overlap well in threads; on Linux they are cheap /proc reads and threads
+        only add overhead. Results land in the probe cache for the caller's serial pass.
+        """
+        if self._probe_executor is None:
+            return
+        
+        cache = self._service_probe_cache
+        skipped_pids = self._skipped_pids
+        new_procs = []
+        for proc in procs:
+            if proc.pid in skipped_pids:
+                continue
+            try:
+                if (proc.pid, proc.create_time()) not in cache:
+                    new_procs.append(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+        
+        if len(new_procs) > 1:
+            # _probe_service handles process errors itself; consume the results to wait for them
+            for _ in self._probe_executor.map(self._probe_service, new_procs):
+                pass
+    
+    def _prune_service_probe_cache(self, live_pids):
+        """Drop cached service detection results, start times and detail samples for processes that have exited"""
+        cache = self._service_probe_cache
+        if any(pid not in live_pids for pid, _ in cache):
+            self._service_probe_cache = {key: value for key, value in cache.items() if key[0] in live_pids}
+        start_times = self._start_time_cache
+        if any(pid not in live_pids for pid, _ in start_times):
+            self._start_time_cache = {key: value for key, value in start_times.items() if key[0] in live_pids}
+        detail_procs = self._detail_processes
+        if any(pid not in live_pids for pid in detail_procs):
+            self._detail_processes = {pid: value for pid, value in detail_procs.items() if pid in live_pids}
+    
+    def _expire_non_service_probes(self):
+        """Forget cached "not a service" results every NON_SERVICE_RECHECK_INTERVAL seconds (macOS/Linux)"""
+        if not self._recheck_probes:
+            return
+        now = time.monotonic()
+        if now - self._non_services_checked_at >= NON_SERVICE_RECHECK_INTERVAL:
+            self._non_services_checked_at = now
+            self._service_probe_cache = {key: value for key, value in self._service_probe_cache.items()
+                                         if value is not None}
+    
+    def _get_start_time_text(self, pid, create_time):
+        """Format a process create time as 'YYYY-MM-DD HH:MM:SS', cached per (pid, create time)"""
+        key = (pid, create_time)
+        start_time = self._start_time_cache.get(key)
+        if start_time is None:
+            start_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(create_time))
+            self._start_time_cache[key] = start_time
+        return start_time
+    
+    def _format_uptime(self, uptime_seconds):
+        """Format seconds like str(timedelta) without microseconds, e.g. '2 days, 3:04:05'"""
+        days, remainder = divmod(uptime_seconds, 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        uptime_formatted = f"{hours}:{minutes:02d}:{seconds:02d}"
+        if days:
+            uptime_formatted = f"{days} day{'s' if days != 1 else ''}, {uptime_formatted}"
+        return uptime_formatted
+    
     def _get_service_name(self, service_path):
         """Extract service name from path"""
         if service_path:
@@ -97,50 +483,21 @@ class ServiceMonitor:
         - MyApp_Port8082.exe -> 8082
         - MyApp.exe -> None
         """
-        if not filename:
-            return None
-        
-        import re
-        # Try to find port number patterns: _8080, -8080, Port8080, etc.
-        patterns = [
-            r'_(\d+)',           # _8080
-            r'-(\d+)',           # -8080
-            r'Port(\d+)',        # Port8080
-            r'port(\d+)',        # port8080
-            r'(\d+)',            # Any number (last resort)
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, filename, re.IGNORECASE)
-            if match:
-                port = match.group(1)
-                # Only return if it looks like a port (reasonable range)
-                if port.isdigit() and 1 <= int(port) <= 65535:
-                    return port
-        
-        return None
+        return extract_port_from_filename(filename)
     
     def _extract_port_from_cmdline(self, cmdline):
         """
         Extract port number from command line arguments.
         Looks for common port patterns: --port=8080, -p 8080, --server.port=8080, etc.
+        Accepts the argument list or the already joined command line string.
         """
         if not cmdline:
             return None
         
-        import re
-        port_patterns = [
-            r'--port[=:](\d+)',
-            r'-p\s+(\d+)',
-            r'--server\.port[=:](\d+)',
-            r'port[=:](\d+)',
-            r'PORT[=:](\d+)',
-        ]
-        
         cmdline_str = ' '.join(cmdline) if isinstance(cmdline, list) else str(cmdline)
         
-        for pattern in port_patterns:
-            match = re.search(pattern, cmdline_str, re.IGNORECASE)
+        for pattern in PORT_CMDLINE_PATTERNS:
+            match = pattern.search(cmdline_str)
             if match:
                 port = match.group(1)
                 if port.isdigit() and 1 <= int(port) <= 65535:
@@ -152,156 +509,261 @@ class ServiceMonitor:
         """Get file type based on extension"""
         if not file_path:
             return "Unknown"
-        ext = os.path.splitext(file_path)[1].lower()
-        if ext == '.jar':
-            return 'JAR'
-        elif ext == '.exe':
-            return 'EXE'
-        elif ext == '.bat':
-            return 'BAT'
-        elif ext == '.sh':
-            return 'SH'
-        return 'Unknown'
+        return FILE_TYPES.get(os.path.splitext(file_path)[1].lower(), 'Unknown')
     
     def get_all_services(self):
-        """Get all running services (JAR, EXE, BAT, SH) with their status and utilization"""
-        services = []
+        """
+        Get all running services (JAR, EXE, BAT, SH) with their status and utilization
+        
+        CPU usage of services found by the previous scan is the usage since that scan,
+        read without blocking; only newly seen services need a short 0.1 second sample.
+        """
+        return list(self.iter_services())
+    
+    def iter_services(self):
+        """
+        Yield the service dicts of get_all_services one at a time, so callers that
+        transform or stream them do not need the whole list in memory
+        """
+        for info in self.iter_service_infos():
+            yield info.to_dict()
+    
+    def iter_service_infos(self):
+        """Yield a ServiceInfo for each running service (the scan behind get_all_services)"""
+        candidates = []  # [(proc, probe, process_name)]
+        live_pids = set()
+        new_procs = False
+        # Readings closer together than MIN_CPU_SAMPLE_INTERVAL are too short to measure usage
+        baseline_ok = time.monotonic() - self._scan_sampled_at >= MIN_CPU_SAMPLE_INTERVAL
         
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'cpu_percent', 'memory_info', 'status', 'create_time']):
+            # First pass: find service processes and prime their CPU counters
+            self._expire_non_service_probes()
+            procs = list(psutil.process_iter())
+            self._probe_new_processes(procs)
+            for proc in procs:
+                live_pids.add(proc.pid)
                 try:
-                    if self._is_service_process(proc):
-                        service_path = self._get_service_path(proc)
-                        service_name = self._get_service_name(service_path)
-                        file_type = self._get_file_type(service_path)
-                        
+                    probe = self._probe_service(proc)
+                    if probe:
                         # Get the actual process name (as shown in Task Manager)
-                        # proc.info contains 'name' when using process_iter with 'name' in attrs
-                        process_name = proc.info.get('name', '') if proc.info else ''
-                        
-                        # Get command line for port extraction
                         try:
-                            cmdline = proc.cmdline()
-                            cmdline_str = ' '.join(cmdline) if cmdline else ''
-                        except (psutil.AccessDenied, psutil.NoSuchProcess):
-                            cmdline = []
-                            cmdline_str = ''
-                        
-                        # Extract port/identifier from filename and command line
-                        port_from_filename = self._extract_port_or_identifier(service_name)
-                        port_from_cmdline = self._extract_port_from_cmdline(cmdline)
-                        # Use port from filename first, then cmdline
-                        port_identifier = port_from_filename or port_from_cmdline
+                            process_name = proc.name()
+                        except psutil.AccessDenied:
+                            process_name = ''
                         
-                        # Get CPU and memory utilization
-                        cpu_percent = proc.cpu_percent(interval=0.1)
-                        memory_info = proc.memory_info()
-                        memory_mb = memory_info.rss / (1024 * 1024)
+                        if self._recheck_probes and process_name != probe.process_name:
+                            # Same pid and create time, different program: the process exec'd
+                            probe = self._probe_service(proc, refresh=True)
+                            if not probe:
+                                continue
                         
-                        # Get process status
-                        status = proc.status()
-                        
-                        # Calculate uptime
-                        create_time = datetime.fromtimestamp(proc.create_time())
-                        uptime = datetime.now() - create_time
-                        
-                        service_info = {
-                            'pid': proc.pid,
-                            'service_name': service_name,
-                            'jar_name': service_name,  # Keep for backward compatibility
-                            'process_name': process_name,  # Actual process name (e.g., "CorrelatorMax.exe")
-                            'service_path': service_path or 'Unknown',
-                            'jar_path': service_path or 'Unknown',  # Keep for backward compatibility
-                            'file_type': file_type,
-                            'status': status,
-                            'cpu_percent': round(cpu_percent, 2),
-                            'memory_mb': round(memory_mb, 2),
-                            'uptime_seconds': int(uptime.total_seconds()),
-                            'uptime_formatted': str(uptime).split('.')[0],  # Remove microseconds
-                            'start_time': create_time.strftime('%Y-%m-%d %H:%M:%S'),
-                            'port_identifier': port_identifier,  # Port number or identifier (e.g., "8080")
-                            'cmdline': cmdline_str  # Full command line for debugging/matching
-                        }
-                        
-                        services.append(service_info)
+                        known_proc = self._scan_processes.get(proc.pid)
+                        # psutil.Process equality also compares create time, so a reused PID is treated as new
+                        if known_proc is not None and known_proc == proc:
+                            proc = known_proc
+                        if proc is not known_proc or not baseline_ok:
+                            # The first cpu_percent(None) call only starts the measurement
+                            proc.cpu_percent(interval=None)
+                            new_procs = True
+                        candidates.append((proc, probe, process_name))
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                     continue
         except Exception as e:
             logger.error(f"Error scanning processes: {str(e)}")
             raise
         
-        return services
+        self._prune_service_probe_cache(live_pids)
+        
+        # One shared sampling interval for new processes instead of 0.1 seconds per process
+        if new_procs:
+            time.sleep(MIN_CPU_SAMPLE_INTERVAL)
+        
+        # Second pass: read utilization and build the service entries
+        scanned_procs = {}
+        scan_time = time.time()  # One clock read for all uptimes in this scan
+        for (proc, probe, process_name), usage in zip(candidates, self._read_scan_usage(candidates)):
+            if usage is None:
+                continue
+            cpu_percent, memory_mb, status, create_time = usage
+            
+            # Calculate uptime
+            uptime_seconds = max(0, int(scan_time - create_time))
+            
+            service_info = ServiceInfo(
+                pid=proc.pid,
+                service_name=probe.service_name,
+                process_name=process_name,
+                service_path=probe.service_path or 'Unknown',
+                file_type=probe.file_type,
+                status=status,
+                cpu_percent=round(cpu_percent, 2),
+                memory_mb=round(memory_mb, 2),
+                uptime_seconds=uptime_seconds,
+                uptime_formatted=self._format_uptime(uptime_seconds),
+                start_time=self._get_start_time_text(proc.pid, create_time),
+                port_identifier=probe.port_identifier,
+                cmdline=probe.cmdline_str
+            )
+            
+            scanned_procs[proc.pid] = proc
+            yield service_info
+        
+        self._scan_processes = scanned_procs
+        self._scan_sampled_at = time.monotonic()
+    
+    def _read_scan_usage(self, candidates):
+        """
+        Return an iterator of (cpu_percent, memory_mb, status, create_time), or None for a
+        process that has gone, in the order of candidates
+        On Windows the reads overlap in the probe thread pool like the command line reads
+        of _probe_new_processes; elsewhere they are cheap and run serially
+        """
+        procs = [proc for proc, _, _ in candidates]
+        if self._probe_executor is not None and len(procs) > 1:
+            return self._probe_executor.map(self._read_process_usage, procs)
+        return map(self._read_process_usage, procs)
+    
+    def _read_process_usage(self, proc):
+        """Read one scanned process's utilization (CPU since the first pass) in a single oneshot()"""
+        try:
+            with proc.oneshot():
+                cpu_percent = proc.cpu_percent(interval=None)
+                memory_mb = proc.memory_info().rss / (1024 * 1024)
+                return cpu_percent, memory_mb, proc.status(), proc.create_time()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
     
-    def get_service_details(self, pid):
-        """Get detailed information about a specific service"""
+    def get_all_services_columnar(self, services=None):
+        """
+        Get running services as a header plus one row per service (DataTables style)
+        Returns {'columns': [...], 'rows': [[...], ...]}; pass services to reuse an existing scan
+        """
+        if services is None:
+            # Read the fields straight from a fresh scan, without building a dict per service
+            rows = [[getattr(info, column) for column in SERVICE_COLUMNS] for info in self.iter_service_infos()]
+        else:
+            rows = [[service.get(column) for column in SERVICE_COLUMNS] for service in services]
+        return {
+            'columns': list(SERVICE_COLUMNS),
+            'rows': rows
+        }
+    
+    def snapshot_connection_counts(self):
+        """
+        Count inet connections per PID with a single system-wide scan
+        Pass the result to get_service_details when fetching details for many services;
+        returns None if the system table cannot be read (e.g. macOS without root)
+        """
+        try:
+            return Counter(conn.pid for conn in psutil.net_connections(kind='inet') if conn.pid)
+        except (psutil.AccessDenied, OSError) as e:
+            logger.debug(f"Could not read system connection table: {str(e)}")
+            return None
+    
+    def get_service_details(self, pid, conn_counts=None):
+        """
+        Get detailed information about a specific service
+        
+        Args:
+            pid: Process ID of the service
+            conn_counts: Optional {pid: connection count} from snapshot_connection_counts;
+                without it the process's own connections are listed
+        
+        CPU usage is the usage since the previous details request for the same process,
+        read without blocking; a first request, or one within MIN_CPU_SAMPLE_INTERVAL of the
+        previous, takes a short blocking sample.
+        """
         try:
             proc = psutil.Process(pid)
+            known_proc, sampled_at = self._detail_processes.get(pid, (None, 0.0))
+            # psutil.Process equality also compares create time, so a reused PID is treated as new
+            if (known_proc is not None and known_proc == proc
+                    and time.monotonic() - sampled_at >= MIN_CPU_SAMPLE_INTERVAL):
+                proc = known_proc
+                cpu_interval = None
+            else:
+                cpu_interval = MIN_CPU_SAMPLE_INTERVAL
             
-            if not self._is_service_process(proc):
+            # One cached command line read for detection, path, file type and the cmdline field
+            probe = self._probe_service(proc)
+            if not probe:
                 return None
             
-            service_path = self._get_service_path(proc)
-            service_name = self._get_service_name(service_path)
-            file_type = self._get_file_type(service_path)
-            
-            # Get the actual process name (as shown in Task Manager)
-            try:
-                process_name = proc.name()
-            except (psutil.NoSuchProcess, AttributeError):
-                process_name = ''
-            
-            # Get comprehensive process information
-            cpu_percent = proc.cpu_percent(interval=0.1)
-            memory_info = proc.memory_info()
-            memory_mb = memory_info.rss / (1024 * 1024)
+            service_path = probe.service_path
+            service_name = probe.service_name
+            file_type = probe.file_type
             
-            # Get command line
-            cmdline = ' '.join(proc.cmdline())
+            # Sample CPU before oneshot(): inside it a blocking sample would read cached CPU times twice
+            cpu_percent = proc.cpu_percent(interval=cpu_interval)
+            self._detail_processes[pid] = (proc, time.monotonic())
             
-            # Get process status
-            status = proc.status()
-            
-            # Calculate uptime
-            create_time = datetime.fromtimestamp(proc.create_time())
-            uptime = datetime.now() - create_time
-            
-            # Get number of threads
-            num_threads = proc.num_threads()
-            
-            # Get open files/connections count
-            try:
-                num_fds = len(proc.open_files())
-            except (psutil.AccessDenied, AttributeError):
-                num_fds = 0
-            
-            # Get network connections
-            try:
-                connections = proc.connections()
-                num_connections = len(connections)
-            except (psutil.AccessDenied, AttributeError):
-                num_connections = 0
-            
-            details = {
-                'pid': pid,
-                'service_name': service_name,
-                'jar_name': service_name,  # Keep for backward compatibility
-                'process_name': process_name,  # Actual process name (e.g., "CorrelatorMax.exe")
-                'service_path': service_path or 'Unknown',
-                'jar_path': service_path or 'Unknown',  # Keep for backward compatibility
-                'file_type': file_type,
-                'status': status,
-                'cpu_percent': round(cpu_percent, 2),
-                'memory_mb': round(memory_mb, 2),
-                'memory_percent': round(proc.memory_percent(), 2),
-                'uptime_seconds': int(uptime.total_seconds()),
-                'uptime_formatted': str(uptime).split('.')[0],
-                'start_time': create_time.strftime('%Y-%m-%d %H:%M:%S'),
-                'num_threads': num_threads,
-                'num_open_files': num_fds,
-                'num_connections': num_connections,
-                'cmdline': cmdline,
-                'username': proc.username() if hasattr(proc, 'username') else 'Unknown'
-            }
+            # Read the other metrics in one oneshot() so shared /proc and Windows queries run once
+            with proc.oneshot():
+                # Get the actual process name (as shown in Task Manager)
+                try:
+                    process_name = proc.name()
+                except (psutil.NoSuchProcess, AttributeError):
+                    process_name = ''
+                
+                # Get comprehensive process information
+                memory_info = proc.memory_info()
+                memory_mb = memory_info.rss / (1024 * 1024)
+                
+                # Get command line
+                cmdline = probe.cmdline_str
+                
+                # Get process status
+                status = proc.status()
+                
+                # Calculate uptime
+                create_time = proc.create_time()
+                uptime_seconds = max(0, int(time.time() - create_time))
+                
+                # Get number of threads
+                num_threads = proc.num_threads()
+                
+                # Get open file descriptor (POSIX) or handle (Windows) count; unlike
+                # len(open_files()) this is one call, without listing and stat-ing every file
+                try:
+                    if self.system == 'Windows':
+                        num_fds = proc.num_handles()
+                    else:
+                        num_fds = proc.num_fds()
+                except (psutil.AccessDenied, AttributeError):
+                    num_fds = 0
+                
+                # Get network connections
+                if conn_counts is not None:
+                    num_connections = conn_counts.get(pid, 0)
+                else:
+                    try:
+                        connections = proc.net_connections()
+                        num_connections = len(connections)
+                    except (psutil.AccessDenied, AttributeError):
+                        num_connections = 0
+                
+                details = {
+                    'pid': pid,
+                    'service_name': service_name,
+                    'jar_name': service_name,  # Keep for backward compatibility
+                    'process_name': process_name,  # Actual process name (e.g., "CorrelatorMax.exe")
+                    'service_path': service_path or 'Unknown',
+                    'jar_path': service_path or 'Unknown',  # Keep for backward compatibility
+                    'file_type': file_type,
+                    'status': status,
+                    'cpu_percent': round(cpu_percent, 2),
+                    'memory_mb': round(memory_mb, 2),
+                    'memory_percent': round(proc.memory_percent(), 2),
+                    'uptime_seconds': uptime_seconds,
+                    'uptime_formatted': self._format_uptime(uptime_seconds),
+                    'start_time': self._get_start_time_text(pid, create_time),
+                    'num_threads': num_threads,
+                    'num_open_files': num_fds,
+                    'num_connections': num_connections,
+                    'cmdline': cmdline,
+                    'username': proc.username() if hasattr(proc, 'username') else 'Unknown'
+                }
             
             return details
         except psutil.NoSuchProcess:
@@ -310,12 +772,86 @@ class ServiceMonitor:
             logger.error(f"Error getting service details: {str(e)}")
             raise
     
-    def stop_service(self, pid):
-        """Stop a service (JAR, EXE, BAT, SH)"""
+    def get_many_details(self, pids):
+        """
+        Get CPU and memory utilization for several services
+        Returns a dict of {pid: ServiceUsage} for the pids that are still running services
+        
+        CPU usage is non-blocking for processes sampled by the previous call (usage
+        since that call); newly seen processes, or all of them when the previous call
+        was less than MIN_CPU_SAMPLE_INTERVAL ago, share one short blocking sample.
+        Not thread-safe: meant to be called from the auto-restart monitor thread only.
+        """
+        wanted_pids = set(pids)
+        if not wanted_pids:
+            self._usage_processes = {}
+            return {}
+        
+        # Readings closer together than MIN_CPU_SAMPLE_INTERVAL are too short to measure usage
+        baseline_ok = time.monotonic() - self._usage_sampled_at >= MIN_CPU_SAMPLE_INTERVAL
+        
+        # Look the requested processes up directly, reusing the ones sampled last time
+        procs = {}
+        new_procs = False
+        for pid in wanted_pids:
+            try:
+                proc = psutil.Process(pid)
+                known_proc = self._usage_processes.get(pid)
+                # psutil.Process equality also compares create time, so a reused PID is treated as new
+                if known_proc is not None and known_proc == proc:
+                    proc = known_proc
+                elif not self._probe_service(proc):
+                    continue
+                if proc is not known_proc or not baseline_ok:
+                    # Prime the CPU counter of a newly seen process
+                    proc.cpu_percent(interval=None)
+                    new_procs = True
+                procs[pid] = proc
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+        
+        # One shared sampling interval for new processes instead of 0.1 seconds per process
+        if new_procs:
+            time.sleep(MIN_CPU_SAMPLE_INTERVAL)
+        
+        details = {}
+        for pid, proc in procs.items():
+            try:
+                probe = self._probe_service(proc)
+                if not probe:
+                    continue
+                with proc.oneshot():
+                    cpu_percent = proc.cpu_percent(interval=None)
+                    memory_mb = proc.memory_info().rss / (1024 * 1024)
+                
+                details[pid] = ServiceUsage(
+                    pid=pid,
+                    service_name=probe.service_name,
+                    service_path=probe.service_path or 'Unknown',
+                    file_type=probe.file_type,
+                    cpu_percent=round(cpu_percent, 2),
+                    memory_mb=round(memory_mb, 2)
+                )
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+        
+        self._usage_processes = {pid: procs[pid] for pid in details}
+        self._usage_sampled_at = time.monotonic()
+        return details
+    
+    def stop_service(self, pid, on_done=None):
+        """
+        Stop a service (JAR, EXE, BAT, SH)
+        
+        Without on_done, waits until the process has exited (up to STOP_TIMEOUT + KILL_TIMEOUT
+        seconds) and returns the result. With on_done, returns right after terminate() with
+        'pending': True; the exit is confirmed in the background, and on_done is called with
+        the final result, which get_stop_status(pid) also reports.
+        """
         try:
-            proc = psutil.Process(pid)
+            proc, _ = self._get_process(pid)
             
-            if not self._is_service_process(proc):
+            if not self._probe_service(proc):
                 return {
                     'success': False,
                     'error': 'Process is not a monitored service'
@@ -324,30 +860,27 @@ class ServiceMonitor:
             # Try graceful termination first
             try:
                 proc.terminate()
-                proc.wait(timeout=10)
-                return {
-                    'success': True,
-                    'message': 'Service stopped gracefully'
-                }
-            except psutil.TimeoutExpired:
-                # Force kill if graceful termination fails
-                try:
-                    proc.kill()
-                    proc.wait(timeout=5)
-                    return {
-                        'success': True,
-                        'message': 'Service force stopped'
-                    }
-                except Exception as e:
-                    return {
-                        'success': False,
-                        'error': f'Failed to kill process: {str(e)}'
-                    }
             except Exception as e:
                 return {
                     'success': False,
                     'error': f'Failed to stop process: {str(e)}'
                 }
+            
+            if on_done is None:
+                return self._wait_for_stop(proc)
+            
+            future = self._stop_executor.submit(self._wait_for_stop, proc)
+            with self._pending_stops_lock:
+                # Results nobody asked for are not kept forever
+                if len(self._pending_stops) >= MAX_PENDING_STOPS:
+                    self._pending_stops = {p: f for p, f in self._pending_stops.items() if not f.done()}
+                self._pending_stops[pid] = future
+            future.add_done_callback(lambda f: on_done(f.result()))
+            return {
+                'success': True,
+                'pending': True,
+                'message': 'Service stop initiated'
+            }
         except psutil.NoSuchProcess:
             return {
                 'success': False,
@@ -360,145 +893,347 @@ class ServiceMonitor:
                 'error': str(e)
             }
     
-    def start_service(self, service_path, args=None, working_directory=None):
+    def _wait_for_stop(self, proc):
+        """Wait for a terminated process to exit, force killing it after STOP_TIMEOUT seconds"""
+        try:
+            proc.wait(timeout=STOP_TIMEOUT)
+            result = {
+                'success': True,
+                'message': 'Service stopped gracefully'
+            }
+        except psutil.TimeoutExpired:
+            # Force kill if graceful termination fails
+            try:
+                proc.kill()
+                proc.wait(timeout=KILL_TIMEOUT)
+                result = {
+                    'success': True,
+                    'message': 'Service force stopped'
+                }
+            except Exception as e:
+                result = {
+                    'success': False,
+                    'error': f'Failed to kill process: {str(e)}'
+                }
+        except Exception as e:
+            result = {
+                'success': False,
+                'error': f'Failed to stop process: {str(e)}'
+            }
+        
+        if result['success']:
+            logger.info(f"Stop confirmed for PID {proc.pid}: {result['message']}")
+        else:
+            logger.error(f"Stop failed for PID {proc.pid}: {result['error']}")
+        return result
+    
+    def stop_services(self, pids):
+        """
+        Stop several services, terminating them all before waiting so the graceful and
+        force-kill timeouts are shared by the batch instead of added up per service
+        
+        Returns:
+            Dict of {pid: result dict as returned by stop_service}
+        """
+        results = {}
+        terminated = []
+        for pid in pids:
+            try:
+                proc, _ = self._get_process(pid)
+                if not self._probe_service(proc):
+                    results[pid] = {
+                        'success': False,
+                        'error': 'Process is not a monitored service'
+                    }
+                    continue
+                proc.terminate()
+                terminated.append(proc)
+            except psutil.NoSuchProcess:
+                results[pid] = {
+                    'success': False,
+                    'error': 'Process not found'
+                }
+            except Exception as e:
+                results[pid] = {
+                    'success': False,
+                    'error': f'Failed to stop process: {str(e)}'
+                }
+        
+        if not terminated:
+            return results
+        
+        gone, alive = psutil.wait_procs(terminated, timeout=STOP_TIMEOUT)
+        for proc in gone:
+            results[proc.pid] = {
+                'success': True,
+                'message': 'Service stopped gracefully'
+            }
+        
+        # Force kill the services that ignored terminate(), then wait for all of them at once
+        killed = []
+        for proc in alive:
+            try:
+                proc.kill()
+                killed.append(proc)
+            except psutil.NoSuchProcess:
+                killed.append(proc)
+            except Exception as e:
+                results[proc.pid] = {
+                    'success': False,
+                    'error': f'Failed to kill process: {str(e)}'
+                }
+        gone, alive = psutil.wait_procs(killed, timeout=KILL_TIMEOUT)
+        for proc in gone:
+            results[proc.pid] = {
+                'success': True,
+                'message': 'Service force stopped'
+            }
+        for proc in alive:
+            results[proc.pid] = {
+                'success': False,
+                'error': f'Failed to kill process: still running after {KILL_TIMEOUT} seconds'
+            }
+        
+        for proc in terminated:
+            result = results[proc.pid]
+            if result['success']:
+                logger.info(f"Stop confirmed for PID {proc.pid}: {result['message']}")
+            else:
+                logger.error(f"Stop failed for PID {proc.pid}: {result['error']}")
+        return results
+    
+    def get_stop_status(self, pid):
+        """
+        Status of a stop started with stop_service(pid, on_done=...)
+        Returns None if there is no such stop, {'pending': True} while it is running,
+        or the final stop result (which is then forgotten)
+        """
+        with self._pending_stops_lock:
+            future = self._pending_stops.get(pid)
+            if future is None:
+                return None
+            if not future.done():
+                return {'success': True, 'pending': True}
+            del self._pending_stops[pid]
+        return future.result()
+    
+    def start_service(self, service_path, args=None, working_directory=None, on_done=None):
         """Start a service (JAR, EXE, BAT, SH) as a detached process that survives parent termination
         
+        Without on_done, waits up to START_CHECK_TIMEOUT seconds for an early exit and returns the
+        result. With on_done, returns right after launching with 'pending': True; a background
+        watcher waits up to START_WATCH_TIMEOUT seconds for an early exit, and on_done is called
+        with the final result, which get_start_status(pid) also reports.
+        
         Args:
             service_path: Full path to the executable file
             args: Optional arguments to pass to the service
             working_directory: Optional working directory (defaults to executable's directory)
+            on_done: Optional callback taking the final result dict
         """
         try:
-            # Normalize the path to ensure proper formatting
-            service_path = os.path.normpath(service_path)
+            process, file_ext, error_result = self._launch_service(service_path, args, working_directory)
+            if error_result:
+                return error_result
             
-            if not os.path.exists(service_path):
+            if on_done is not None:
+                future = self._start_executor.submit(self._watch_start, process, os.path.normpath(service_path), file_ext)
+                with self._pending_starts_lock:
+                    # Results nobody asked for are not kept forever
+                    if len(self._pending_starts) >= MAX_PENDING_STARTS:
+                        self._pending_starts = {p: f for p, f in self._pending_starts.items() if not f.done()}
+                    self._pending_starts[process.pid] = future
+                future.add_done_callback(lambda f: on_done(f.result()))
                 return {
-                    'success': False,
-                    'error': f'Service file not found: {service_path}'
+                    'success': True,
+                    'pid': process.pid,
+                    'pending': True,
+                    'message': f'Service start initiated ({file_ext})'
                 }
             
-            # Set working directory: use provided directory, or executable's directory
-            if working_directory:
-                cwd = working_directory
-            else:
-                cwd = os.path.dirname(os.path.abspath(service_path))
-            
-            # Determine file type and build appropriate command
-            file_ext = os.path.splitext(service_path)[1].lower()
-            cmd = []
+            # An exit within START_CHECK_TIMEOUT means the service failed to start
+            try:
+                process.wait(timeout=START_CHECK_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                pass
             
+            return self._start_result(process, os.path.normpath(service_path), file_ext)
+        except Exception as e:
+            logger.error(f"Error starting service: {str(e)}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
+    def _watch_start(self, process, service_path, file_ext):
+        """Wait up to START_WATCH_TIMEOUT seconds for a launched service to exit, then build its result"""
+        try:
+            process.wait(timeout=START_WATCH_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            pass
+        return self._start_result(process, service_path, file_ext)
+    
+    def get_start_status(self, pid):
+        """
+        Status of a start launched with start_service(..., on_done=...)
+        Returns None if there is no such start, {'pending': True} while it is being watched,
+        or the final start result (which is then forgotten)
+        """
+        with self._pending_starts_lock:
+            future = self._pending_starts.get(pid)
+            if future is None:
+                return None
+            if not future.done():
+                return {'success': True, 'pid': pid, 'pending': True}
+            del self._pending_starts[pid]
+        return future.result()
+    
+    def start_services(self, service_paths, working_directory=None):
+        """
+        Start several services, launching them all before checking for start failures
+        so the check takes START_CHECK_TIMEOUT once per batch instead of once per service
+        
+        Returns:
+            Dict of {service_path: result dict as returned by start_service}
+        """
+        results = {}
+        launched = []  # [(service_path, process, file_ext)]
+        for service_path in service_paths:
+            try:
+                process, file_ext, error_result = self._launch_service(service_path, working_directory=working_directory)
+            except Exception as e:
+                logger.error(f"Error starting service: {str(e)}")
+                results[service_path] = {
+                    'success': False,
+                    'error': str(e)
+                }
+                continue
+            if error_result:
+                results[service_path] = error_result
+            else:
+                launched.append((service_path, process, file_ext))
+        
+        # One shared deadline: the batch waits START_CHECK_TIMEOUT at most, not once per service
+        deadline = time.monotonic() + START_CHECK_TIMEOUT
+        for service_path, process, file_ext in launched:
+            try:
+                process.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                pass
+            results[service_path] = self._start_result(process, os.path.normpath(service_path), file_ext)
+        
+        return results
+    
+    def _build_jar_command(self, service_path, args):
+        """Java JAR file: JVM arguments go before -jar"""
+        return ['java', *args, '-jar', service_path]
+    
+    def _build_exe_command(self, service_path, args):
+        """Windows executable"""
+        return [service_path, *args]
+    
+    def _build_bat_command(self, service_path, args):
+        """Windows batch file"""
+        return ['cmd', '/c', service_path, *args]
+    
+    def _build_sh_command(self, service_path, args):
+        """Shell script (macOS/Linux)"""
+        # Make sure script is executable
+        if not os.access(service_path, os.X_OK):
+            os.chmod(service_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
+        return ['/bin/bash', service_path, *args]
+    
+    def _launch_service(self, service_path, args=None, working_directory=None):
+        """
+        Build the command for a service file and spawn it as a detached process
+        Returns (process, file_ext, None), or (None, None, error result dict) if it cannot be started
+        """
+        # Normalize the path to ensure proper formatting
+        service_path = os.path.normpath(service_path)
+        
+        if not os.path.exists(service_path):
+            return None, None, {
+                'success': False,
+                'error': f'Service file not found: {service_path}'
+            }
+        
+        # Set working directory: use provided directory, or executable's directory
+        if working_directory:
+            cwd = working_directory
+        else:
+            cwd = os.path.dirname(os.path.abspath(service_path))
+        
+        # Normalize arguments to a list once for all file types
+        if not args:
+            args = []
+        elif isinstance(args, str):
+            # Quoted arguments may contain spaces; Windows paths keep their backslashes
+            args = args.split() if self.system == 'Windows' else shlex.split(args)
+        elif not isinstance(args, list):
+            args = list(args)
+        
+        # Determine file type and build appropriate command
+        file_ext = os.path.splitext(service_path)[1].lower()
+        build_command = self._command_builders.get(file_ext)
+        if build_command is None:
+            return None, None, {
+                'success': False,
+                'error': PLATFORM_ONLY_ERRORS.get(
+                    file_ext, f'Unsupported file type: {file_ext}. Supported: .jar, .exe, .bat, .sh'
+                )
+            }
+        cmd = build_command(service_path, args)
+        
+        # Prepare process arguments for detached execution
+        process_kwargs = {}
+        
+        if self.system == 'Windows':
+            # Windows: Use DETACHED_PROCESS and CREATE_NEW_PROCESS_GROUP
+            # This makes the process independent of the parent
+            process_kwargs['creationflags'] = WINDOWS_DETACHED_FLAGS
+            # Redirect output to null device to prevent hanging
+            process_kwargs['stdout'] = subprocess.DEVNULL
+            process_kwargs['stderr'] = subprocess.DEVNULL
+            process_kwargs['stdin'] = subprocess.DEVNULL
+        else:
+            # macOS/Linux: Use setsid to create new session and detach from parent
+            process_kwargs['stdout'] = subprocess.DEVNULL
+            process_kwargs['stderr'] = subprocess.DEVNULL
+            process_kwargs['stdin'] = subprocess.DEVNULL
+            process_kwargs['start_new_session'] = True  # Creates new session (detached)
+        
+        # Start the detached process with working directory
+        process_kwargs['cwd'] = cwd
+        process = subprocess.Popen(cmd, **process_kwargs)
+        
+        return process, file_ext, None
+    
+    def _start_result(self, process, service_path, file_ext):
+        """Result dict for a launched service process: success if it is still running"""
+        # Check if process is still running
+        if process.poll() is None:
+            # Process is running and detached
+            logger.info(f"Started detached service: PID {process.pid}, File: {service_path}, Type: {file_ext}")
+            return {
+                'success': True,
+                'pid': process.pid,
+                'message': f'Service started successfully as detached process ({file_ext})'
+            }
+        else:
+            # Process exited immediately (error)
+            error_msg = f'Service failed to start (exit code {process.returncode}). '
             if file_ext == '.jar':
-                # Java JAR file
-                cmd = ['java']
-                if args:
-                    if isinstance(args, str):
-                        cmd.extend(args.split())
-                    elif isinstance(args, list):
-                        cmd.extend(args)
-                cmd.extend(['-jar', service_path])
+                error_msg += 'Check Java installation and JAR file.'
             elif file_ext == '.exe':
-                # Windows executable
-                cmd = [service_path]
-                if args:
-                    if isinstance(args, str):
-                        cmd.extend(args.split())
-                    elif isinstance(args, list):
-                        cmd.extend(args)
+                error_msg += 'Check if executable is compatible with your system.'
             elif file_ext == '.bat':
-                # Windows batch file
-                if self.system == 'Windows':
-                    cmd = ['cmd', '/c', service_path]
-                else:
-                    return {
-                        'success': False,
-                        'error': 'BAT files are only supported on Windows'
-                    }
-                if args:
-                    if isinstance(args, str):
-                        cmd.extend(args.split())
-                    elif isinstance(args, list):
-                        cmd.extend(args)
+                error_msg += 'Check batch file syntax and dependencies.'
             elif file_ext == '.sh':
-                # Shell script (macOS/Linux)
-                if self.system == 'Windows':
-                    return {
-                        'success': False,
-                        'error': 'SH files are not supported on Windows'
-                    }
-                # Make sure script is executable
-                if not os.access(service_path, os.X_OK):
-                    os.chmod(service_path, stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
-                cmd = ['/bin/bash', service_path] if self.system != 'Windows' else [service_path]
-                if args:
-                    if isinstance(args, str):
-                        cmd.extend(args.split())
-                    elif isinstance(args, list):
-                        cmd.extend(args)
-            else:
-                return {
-                    'success': False,
-                    'error': f'Unsupported file type: {file_ext}. Supported: .jar, .exe, .bat, .sh'
-                }
-            
-            # Prepare process arguments for detached execution
-            process_kwargs = {}
-            
-            if platform.system() == 'Windows':
-                # Windows: Use DETACHED_PROCESS and CREATE_NEW_PROCESS_GROUP
-                # This makes the process independent of the parent
-                DETACHED_PROCESS = 0x00000008
-                CREATE_NEW_PROCESS_GROUP = 0x00000200
-                process_kwargs['creationflags'] = DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP
-                # Redirect output to null device to prevent hanging
-                process_kwargs['stdout'] = subprocess.DEVNULL
-                process_kwargs['stderr'] = subprocess.DEVNULL
-                process_kwargs['stdin'] = subprocess.DEVNULL
+                error_msg += 'Check script permissions and syntax.'
             else:
-                # macOS/Linux: Use setsid to create new session and detach from parent
-                process_kwargs['stdout'] = subprocess.DEVNULL
-                process_kwargs['stderr'] = subprocess.DEVNULL
-                process_kwargs['stdin'] = subprocess.DEVNULL
-                process_kwargs['start_new_session'] = True  # Creates new session (detached)
-            
-            # Start the detached process with working directory
-            process_kwargs['cwd'] = cwd
-            process = subprocess.Popen(cmd, **process_kwargs)
-            
-            # Wait a moment to check if it started successfully
-            import time
-            time.sleep(1)
-            
-            # Check if process is still running
-            if process.poll() is None:
-                # Process is running and detached
-                logger.info(f"Started detached service: PID {process.pid}, File: {service_path}, Type: {file_ext}")
-                return {
-                    'success': True,
-                    'pid': process.pid,
-                    'message': f'Service started successfully as detached process ({file_ext})'
-                }
-            else:
-                # Process exited immediately (error)
-                error_msg = f'Service failed to start. '
-                if file_ext == '.jar':
-                    error_msg += 'Check Java installation and JAR file.'
-                elif file_ext == '.exe':
-                    error_msg += 'Check if executable is compatible with your system.'
-                elif file_ext == '.bat':
-                    error_msg += 'Check batch file syntax and dependencies.'
-                elif file_ext == '.sh':
-                    error_msg += 'Check script permissions and syntax.'
-                else:
-                    error_msg += 'Check file and system compatibility.'
-                return {
-                    'success': False,
-                    'error': error_msg
-                }
-        except Exception as e:
-            logger.error(f"Error starting service: {str(e)}")
+                error_msg += 'Check file and system compatibility.'
             return {
                 'success': False,
-                'error': str(e)
+                'error': error_msg
             }
 
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for auto-restart request body validation (parse_auto_restart_payload and its routes)
+Run with: python -m unittest test_app
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import config_storage
+
+# Keep the app's persistent config out of the working directory
+_tmp_dir = tempfile.mkdtemp()
+config_storage.CONFIG_FILE = os.path.join(_tmp_dir, 'monitor_config.json')
+
+import app
+from constants import DEFAULT_CPU_THRESHOLD, DEFAULT_MEMORY_THRESHOLD_MB, DEFAULT_QUEUE_THRESHOLD
+
+TEST_PID = 999999
+
+
+def tearDownModule():
+    shutil.rmtree(_tmp_dir, ignore_errors=True)
+
+
+class ParseAutoRestartPayloadTest(unittest.TestCase):
+    """parse_auto_restart_payload on valid, missing and invalid bodies"""
+
+    def test_missing_body_is_rejected(self):
+        # get_json(silent=True) returns None for a missing or non-JSON body
+        with self.assertRaises(ValueError):
+            app.parse_auto_restart_payload(None)
+
+    def test_non_object_body_is_rejected(self):
+        for body in ('enabled', [True], 1):
+            with self.assertRaises(ValueError):
+                app.parse_auto_restart_payload(body)
+
+    def test_empty_object_uses_defaults(self):
+        payload = app.parse_auto_restart_payload({})
+        self.assertFalse(payload.enabled)
+        self.assertEqual(payload.cpu_threshold, DEFAULT_CPU_THRESHOLD)
+        self.assertEqual(payload.memory_threshold_mb, DEFAULT_MEMORY_THRESHOLD_MB)
+        self.assertEqual(payload.queue_threshold, DEFAULT_QUEUE_THRESHOLD)
+        self.assertIsNone(payload.jar_name)
+
+    def test_valid_body(self):
+        payload = app.parse_auto_restart_payload({
+            'enabled': True,
+            'cpu_threshold': '75',
+            'memory_threshold_mb': 2048,
+            'queue_threshold': 500,
+            'jar_name': 'svc.jar'
+        })
+        self.assertTrue(payload.enabled)
+        self.assertEqual(payload.cpu_threshold, 75.0)
+        self.assertEqual(payload.memory_threshold_mb, 2048.0)
+        self.assertEqual(payload.queue_threshold, 500)
+        self.assertEqual(payload.jar_name, 'svc.jar')
+
+    def test_non_numeric_threshold_is_rejected(self):
+        with self.assertRaises(ValueError):
+            app.parse_auto_restart_payload({'cpu_threshold': 'high'})
+
+    def test_out_of_range_thresholds_are_rejected(self):
+        for body in ({'cpu_threshold': -1}, {'memory_threshold_mb': 0}, {'queue_threshold': -5}):
+            with self.assertRaises(ValueError):
+                app.parse_auto_restart_payload(body)
+
+
+class AutoRestartRoutesTest(unittest.TestCase):
+    """A bad body must not change the stored auto-restart config"""
+
+    def setUp(self):
+        self.client = app.app.test_client()
+        self.config = {
+            'enabled': True,
+            'cpu_threshold': 90.0,
+            'memory_threshold_mb': 1500.0,
+            'queue_threshold': 100,
+            'jar_name': 'svc.jar',
+            'restarting': False
+        }
+        app.update_auto_restart_config(lambda configs: configs.__setitem__(TEST_PID, dict(self.config)))
+
+    def tearDown(self):
+        app.update_auto_restart_config(lambda configs: configs.pop(TEST_PID, None))
+
+    def post_bad_bodies(self, path):
+        for kwargs in ({}, {'data': 'not json', 'content_type': 'application/json'}, {'json': [1, 2]}):
+            response = self.client.post(path, **kwargs)
+            self.assertEqual(response.status_code, 400, kwargs)
+            self.assertFalse(response.get_json()['success'])
+            self.assertEqual(dict(app.auto_restart_config[TEST_PID]), self.config)
+
+    def test_auto_restart_rejects_bad_bodies(self):
+        self.post_bad_bodies(f'/api/service/{TEST_PID}/auto-restart')
+
+    def test_queue_threshold_rejects_bad_bodies(self):
+        self.post_bad_bodies(f'/api/service/{TEST_PID}/queue-threshold')
+
+    def test_restart_ignores_threshold_fields(self):
+        calls = []
+        original = app.restart_service_internal
+        app.restart_service_internal = lambda pid, jar_name, **kwargs: calls.append((pid, jar_name)) or {'success': True, 'pid': pid}
+        try:
+            response = self.client.post(f'/api/service/{TEST_PID}/restart', json={'jar_name': 'svc.jar', 'cpu_threshold': 'high'})
+            self.assertEqual(response.status_code, 200)
+            response = self.client.post(f'/api/service/{TEST_PID}/restart')
+            self.assertEqual(response.status_code, 200)
+        finally:
+            app.restart_service_internal = original
+        self.assertEqual(calls, [(TEST_PID, 'svc.jar'), (TEST_PID, None)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached, atomically written configuration file (config_storage)
+Run with: python -m unittest test_config_storage
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import config_storage
+
+
+class ConfigStorageCacheTest(unittest.TestCase):
+    """load_config caching, invalidation on external changes, and atomic saves"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.original_config_file = config_storage.CONFIG_FILE
+        config_storage.CONFIG_FILE = os.path.join(self.tmp_dir, 'monitor_config.json')
+        config_storage._cached_config = None
+        config_storage._cached_stamp = None
+
+    def tearDown(self):
+        config_storage.CONFIG_FILE = self.original_config_file
+        config_storage._cached_config = None
+        config_storage._cached_stamp = None
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def write_raw(self, text):
+        with open(config_storage.CONFIG_FILE, 'w') as f:
+            f.write(text)
+
+    def test_missing_file_returns_defaults(self):
+        self.assertEqual(config_storage.load_config(), {'auto_restart': {}, 'folder_path': None})
+
+    def test_save_then_load_round_trip(self):
+        config_storage.save_auto_restart_config('svc.jar', {'enabled': True, 'cpu_threshold': 85.0})
+        config_storage.save_folder_path('/srv/jars')
+
+        self.assertEqual(config_storage.get_auto_restart_config_by_name('svc.jar')['cpu_threshold'], 85.0)
+        self.assertEqual(config_storage.get_folder_path(), '/srv/jars')
+        with open(config_storage.CONFIG_FILE) as f:
+            on_disk = json.load(f)
+        self.assertEqual(on_disk['auto_restart']['svc.jar']['cpu_threshold'], 85.0)
+        self.assertEqual(on_disk['folder_path'], '/srv/jars')
+
+    def test_unchanged_file_is_served_from_cache(self):
+        config_storage.save_folder_path('/srv/jars')
+        self.assertIs(config_storage.load_config(), config_storage.load_config())
+
+    def test_external_edit_invalidates_cache(self):
+        config_storage.save_folder_path('/srv/jars')
+        self.assertEqual(config_storage.get_folder_path(), '/srv/jars')
+
+        # Another process rewrites the file; a different size changes the cache stamp
+        self.write_raw(json.dumps({'auto_restart': {}, 'folder_path': '/opt/other/services'}))
+        self.assertEqual(config_storage.get_folder_path(), '/opt/other/services')
+
+    def test_deleted_file_invalidates_cache(self):
+        config_storage.save_folder_path('/srv/jars')
+        os.remove(config_storage.CONFIG_FILE)
+        self.assertIsNone(config_storage.get_folder_path())
+
+    def test_delete_auto_restart_config_is_persisted(self):
+        config_storage.save_auto_restart_config('svc.jar', {'enabled': True})
+        config_storage.delete_auto_restart_config('svc.jar')
+
+        config_storage._cached_config = None  # Force a re-read from disk
+        self.assertIsNone(config_storage.get_auto_restart_config_by_name('svc.jar'))
+
+    def test_corrupt_file_returns_defaults(self):
+        self.write_raw('{"auto_restart": ')
+        self.assertEqual(config_storage.load_config(), {'auto_restart': {}, 'folder_path': None})
+
+    def test_missing_sections_are_filled_in(self):
+        self.write_raw(json.dumps({'folder_path': '/srv/jars'}))
+        config = config_storage.load_config()
+        self.assertEqual(config['auto_restart'], {})
+        self.assertEqual(config['folder_path'], '/srv/jars')
+
+    def test_save_without_orjson(self):
+        # orjson is optional; saves fall back to the standard json module
+        original_orjson = config_storage.orjson
+        config_storage.orjson = None
+        try:
+            config_storage.save_auto_restart_config('svc.jar', {'enabled': True, 'cpu_threshold': 85.0})
+        finally:
+            config_storage.orjson = original_orjson
+        with open(config_storage.CONFIG_FILE) as f:
+            self.assertEqual(json.load(f)['auto_restart']['svc.jar'], {'enabled': True, 'cpu_threshold': 85.0})
+
+    def test_save_leaves_no_temp_files(self):
+        config_storage.save_folder_path('/srv/jars')
+        config_storage.save_folder_path('/srv/other')
+        self.assertEqual(os.listdir(self.tmp_dir), ['monitor_config.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()
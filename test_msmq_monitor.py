@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the PowerShell queue name filter built by MSMQMonitor
+Run with: python -m unittest test_msmq_monitor
+"""
+
+import os
+import re
+import unittest
+import warnings
+
+import msmq_monitor
+from msmq_monitor import MSMQMonitor
+
+QUEUE_NAMES = [
+    'machine\\private$\\app_8080',
+    'MACHINE\\PRIVATE$\\Billing.Service',
+    'machine/private$/tool',
+    'machine\\private$\\other',
+    'plainqueue',
+]
+FILTER_NAMES = ['App_8080.exe', 'billing.jar', 'Tool.sh', 'plainqueue']
+
+
+def python_simple_name(queue_name):
+    """Simple queue name as the Python (WMI COM) path computes it"""
+    simple_name = re.split(r'[\\/]', queue_name)[-1].replace('$', '')
+    return os.path.splitext(simple_name)[0]
+
+
+def powershell_simple_name(script, queue_name):
+    """Apply the -split and -replace regexes of a generated script the way PowerShell does"""
+    split_pattern = re.search(r"-split '([^']*)'", script).group(1)
+    replace_patterns = re.findall(r"-replace '([^']*)', ''", script)
+    simple_name = re.split(split_pattern, queue_name)[-1]
+    for pattern in replace_patterns:
+        simple_name = re.sub(pattern, '', simple_name)
+    return simple_name
+
+
+class QueueNameFilterTest(unittest.TestCase):
+    """The PowerShell filter must select the same queues as the Python filter"""
+
+    def setUp(self):
+        self.monitor = MSMQMonitor()
+        self.scripts = []
+        # Build the scripts as on Windows without running PowerShell
+        self.monitor.is_windows = True
+        self.monitor._wmi_enabled = False
+        self.monitor._execute_powershell = lambda command, on_line=None: self.scripts.append(command) or ''
+
+    def generated_scripts(self):
+        self.monitor.get_all_queues(filter_names=FILTER_NAMES)
+        self.monitor._get_queues_wmi(filter_names=FILTER_NAMES)
+        self.assertEqual(len(self.scripts), 2)
+        return self.scripts
+
+    def test_module_has_no_invalid_escape_sequences(self):
+        with open(msmq_monitor.__file__, encoding='utf-8') as f:
+            source = f.read()
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            compile(source, msmq_monitor.__file__, 'exec')
+
+    def test_scripts_split_paths_like_python(self):
+        for script in self.generated_scripts():
+            self.assertIn("-split '[\\\\/]'", script)
+            for queue_name in QUEUE_NAMES:
+                self.assertEqual(powershell_simple_name(script, queue_name).lower(),
+                                 python_simple_name(queue_name).lower(), queue_name)
+
+    def test_scripts_select_the_same_queues_as_python(self):
+        wanted = {os.path.splitext(name)[0].lower() for name in FILTER_NAMES}
+        expected = [name for name in QUEUE_NAMES if python_simple_name(name).lower() in wanted]
+        self.assertEqual(len(expected), 4)
+        for script in self.generated_scripts():
+            # -contains compares case-insensitively
+            selected = [name for name in QUEUE_NAMES if powershell_simple_name(script, name).lower() in wanted]
+            self.assertEqual(selected, expected)
+
+    def test_names_are_quoted_powershell_literals(self):
+        self.assertEqual(self.monitor._build_queue_name_filter(["App_8080.exe", "O'Brien.jar"]),
+                         "$names = @('App_8080','O''Brien')")
+        self.assertEqual(self.monitor._build_queue_name_filter(None), '$names = $null')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for ServiceMonitor: CPU sampling (get_many_details and get_service_details)
+and service detection of processes that exec another program
+Run with: python -m unittest test_service_monitor
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+from service_monitor import NON_SERVICE_RECHECK_INTERVAL, ServiceMonitor
+
+# A single-threaded busy loop uses close to one full core; a broken sample reads 0% or spikes
+MIN_BUSY_CPU = 20.0
+MAX_BUSY_CPU = 110.0
+
+
+@unittest.skipUnless(os.name == 'posix' and shutil.which('bash'), 'needs bash to run a .sh service')
+class CpuSamplingTest(unittest.TestCase):
+    """CPU readings taken right after a scan must cover a real interval"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        script = os.path.join(cls.tmp_dir, 'busy_service.sh')
+        with open(script, 'w') as f:
+            f.write('#!/bin/bash\nwhile :; do :; done\n')
+        cls.process = subprocess.Popen(['/bin/bash', script])
+        cls.pid = cls.process.pid
+        time.sleep(0.2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.process.kill()
+        cls.process.wait()
+        shutil.rmtree(cls.tmp_dir, ignore_errors=True)
+
+    def setUp(self):
+        self.monitor = ServiceMonitor()
+
+    def assertBusy(self, cpu_percent):
+        self.assertGreaterEqual(cpu_percent, MIN_BUSY_CPU)
+        self.assertLessEqual(cpu_percent, MAX_BUSY_CPU)
+
+    def scan(self):
+        services = {service['pid']: service for service in self.monitor.get_all_services()}
+        self.assertIn(self.pid, services)
+        return services[self.pid]
+
+    def test_scan_measures_usage(self):
+        self.scan()
+        time.sleep(0.3)
+        self.assertBusy(self.scan()['cpu_percent'])
+
+    def test_many_details_right_after_scan(self):
+        # The auto-restart monitor scans, then reads usage of the configured services at once
+        for _ in range(3):
+            self.scan()
+            usage = self.monitor.get_many_details([self.pid])
+            self.assertIn(self.pid, usage)
+            self.assertBusy(usage[self.pid].cpu_percent)
+            time.sleep(0.3)
+
+    def test_many_details_called_twice_in_a_row(self):
+        self.monitor.get_many_details([self.pid])
+        usage = self.monitor.get_many_details([self.pid])
+        self.assertBusy(usage[self.pid].cpu_percent)
+
+    def test_many_details_skips_non_services(self):
+        self.assertEqual(self.monitor.get_many_details([os.getpid()]), {})
+        self.assertEqual(self.monitor.get_many_details([]), {})
+
+    def test_details_right_after_scan(self):
+        for _ in range(3):
+            self.scan()
+            details = self.monitor.get_service_details(self.pid)
+            self.assertBusy(details['cpu_percent'])
+            time.sleep(0.3)
+
+    def test_details_called_twice_in_a_row(self):
+        self.monitor.get_service_details(self.pid)
+        self.assertBusy(self.monitor.get_service_details(self.pid)['cpu_percent'])
+
+    def test_sampling_objects_are_not_shared_with_scan(self):
+        # process_iter returns the same cached objects to every caller
+        self.scan()
+        self.monitor.get_many_details([self.pid])
+        self.monitor.get_service_details(self.pid)
+        scan_proc = self.monitor._scan_processes[self.pid]
+        self.assertIsNot(self.monitor._usage_processes[self.pid], scan_proc)
+        self.assertIsNot(self.monitor._detail_processes[self.pid][0], scan_proc)
+
+
+@unittest.skipUnless(os.name == 'posix' and shutil.which('bash'), 'needs bash and exec semantics')
+class ExecDetectionTest(unittest.TestCase):
+    """A process that execs keeps its pid and create time; its cached detection must not stick"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.monitor = ServiceMonitor()
+        self.process = None
+
+    def tearDown(self):
+        if self.process is not None:
+            self.process.kill()
+            self.process.wait()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def write_script(self, name, body):
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, 'w') as f:
+            f.write('#!/bin/bash\n' + body + '\n')
+        return path
+
+    def scanned_pids(self):
+        return {service['pid'] for service in self.monitor.get_all_services()}
+
+    def wait_for_exec(self, name):
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            with open(f'/proc/{self.process.pid}/comm') as f:
+                if f.read().strip() == name:
+                    return
+            time.sleep(0.05)
+        self.fail(f'process did not exec {name}')
+
+    @unittest.skipUnless(os.path.isdir('/proc'), 'reads /proc to wait for the exec')
+    def test_non_service_that_execs_a_service_is_found(self):
+        script = self.write_script('late_service.sh', 'while :; do sleep 1; done')
+        # Python waits for stdin to close, then execs bash on the script; no argument ends in .sh before that
+        code = 'import os, sys; sys.stdin.read(); os.execv("/bin/bash", ["bash", os.environ["SERVICE_SCRIPT"]])'
+        self.process = subprocess.Popen([sys.executable, '-c', code], stdin=subprocess.PIPE,
+                                        env=dict(os.environ, SERVICE_SCRIPT=script))
+        time.sleep(0.1)
+        self.assertNotIn(self.process.pid, self.scanned_pids())
+
+        self.process.stdin.close()  # Ends the read, so Python execs the service now
+        self.wait_for_exec('bash')
+        time.sleep(0.1)
+        self.monitor._non_services_checked_at -= NON_SERVICE_RECHECK_INTERVAL
+        self.assertIn(self.process.pid, self.scanned_pids())
+
+    @unittest.skipUnless(os.path.isdir('/proc'), 'reads /proc to wait for the exec')
+    def test_service_that_execs_another_program_is_dropped(self):
+        script = self.write_script('wrapper.sh', 'read -t 5; exec sleep 30')
+        self.process = subprocess.Popen(['/bin/bash', script], stdin=subprocess.PIPE)
+        time.sleep(0.1)
+        self.assertIn(self.process.pid, self.scanned_pids())
+
+        self.process.stdin.close()
+        self.wait_for_exec('sleep')
+        self.assertNotIn(self.process.pid, self.scanned_pids())
+
+
+if __name__ == '__main__':
+    unittest.main()